@@ -1,5 +1,54 @@
-import binascii
-from array import array
+# lookup table to reverse the bit order of a byte (used for little endian bitmaps)
+BITREV = bytes(int(f'{byte:08b}'[::-1], 2) for byte in range(256))
+
+# lookup table of the bit values (most significant first) for each byte value
+BYTE_BOOLS = tuple(tuple(bool(byte & (0x80 >> bit)) for bit in range(8)) for byte in range(256))
+
+# translate table from bit values (0/1 bytes) to the ascii digits '0'/'1'
+BINARY_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+# lookup table of the set bit numbers (1-8, most significant first) for each byte value
+BYTE_BITS = tuple(tuple(bit for bit in range(1, 9) if byte & (0x100 >> bit)) for byte in range(256))
+
+
+def bitmap_to_list(data):
+    """
+    Expand bitmap bytes to a list of bit values.
+    ISO8583 bitmaps are big endian - the most significant bit of the first byte is bit 1.
+
+    :param data: the bitmap bytes
+    :return: list of bools, one per bit
+    """
+    bits = []
+    extend = bits.extend
+    for byte in data:
+        extend(BYTE_BOOLS[byte])
+    return bits
+
+
+def bitmap_bits(data):
+    """
+    Get the numbers of the bits set in bitmap bytes, in ascending order.
+    ISO8583 bitmaps are big endian - the most significant bit of the first byte is bit 1.
+
+    :param data: the bitmap bytes
+    :return: list of the set bit numbers, starting from 1
+    """
+    return [index * 8 + bit for index, byte in enumerate(data) if byte for bit in BYTE_BITS[byte]]
+
+
+def list_to_bitmap(bits):
+    """
+    Pack a list of bit values to bitmap bytes (big endian)
+
+    :param bits: list of bit values, length should be a multiple of 8
+    :return: the bitmap bytes
+    """
+    if not bits:
+        return b''
+    # bit values as b'0'/b'1' digits, read as a base 2 number
+    value = int(bytes(map(bool, bits)).translate(BINARY_DIGITS), 2)
+    return value.to_bytes(len(bits) // 8, byteorder='big')
 
 
 class BitArray:
@@ -8,12 +57,15 @@ class BitArray:
     the iso binary bitmap. The bitarray module is written in c and the author does not provide binary wheels so
     forces users to have compilers installed just to install.
     This small class provides the required functions from that library written in pure python.
+
+    The ``bitmap_to_list`` and ``list_to_bitmap`` functions provide the same
+    conversions without creating an object.
     """
-    endian = 'big'
-    bytes = b''
+    __slots__ = ('endian', 'bytes')
 
     def __init__(self, endian='big'):
         self.endian = endian
+        self.bytes = b''
 
     def frombytes(self, array_bytes):
         self.bytes = array_bytes
@@ -22,16 +74,9 @@ class BitArray:
         return self.bytes
 
     def tolist(self):
-        swap_bytes = array('B', self.bytes)
         if self.endian == 'little':
-            for i, n in enumerate(swap_bytes):
-                swap_bytes[i] = int('{:08b}'.format(n)[::-1], 2)
-        width = len(self.bytes)*8
-        swapped_bytes = swap_bytes.tobytes()
-        bit_list = '{bytes:0{width}b}'.format(bytes=int(binascii.hexlify(swapped_bytes), 16), width=width)
-        return [bit == '1' for bit in bit_list]
+            return bitmap_to_list(self.bytes.translate(BITREV))
+        return bitmap_to_list(self.bytes)
 
     def fromlist(self, bytelist):
-        # https://stackoverflow.com/questions/32675679/convert-binary-string-to-bytearray-in-python-3
-        binary_value = ''.join(['1' if val else '0' for val in bytelist])
-        self.bytes = int(binary_value, 2).to_bytes(len(binary_value) // 8, byteorder='big')
+        self.bytes = list_to_bitmap(bytelist)
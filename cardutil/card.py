@@ -50,4 +50,4 @@ def mask(card_number: str, mask_char: str = '*') -> str:
     :param mask_char: the character to use in masking
     :return: masked card number
     """
-    return card_number[0:6] + mask_char * (len(card_number)-10) + card_number[-4:]
+    return f'{card_number[0:6]}{mask_char * (len(card_number)-10)}{card_number[-4:]}'
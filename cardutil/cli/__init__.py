@@ -1,3 +1,7 @@
+import collections
+import csv
+import functools
+import itertools
 import json
 import logging
 import os
@@ -8,6 +12,12 @@ from cardutil.vendor.hexdump import hexdump
 
 LOGGER = logging.getLogger(__name__)
 
+# buffer size used when opening files, reduces the number of read/write syscalls
+IO_BUFFER_SIZE = 1 << 20
+
+VERSION_TEXT = (f'%(prog)s (cardutil {__version__})\n'
+                f'(C)Copyright 2019-2023 Anthony Delosa\n')
+
 
 def print_banner(command_name, parms):
     message = f'{command_name} (cardutil {__version__})'
@@ -30,10 +40,32 @@ def print_exception_details(err: CardutilError):
 
 
 def add_version(parser):
-    version_text = (f'%(prog)s (cardutil {__version__})\n'
-                    f'(C)Copyright 2019-2023 Anthony Delosa\n')
+    parser.add_argument('--version', action='version', version=VERSION_TEXT)
+
+
+def dicts_to_csv(data_list, output_file, field_list=None):
+    """
+    Writes dict data to CSV file
 
-    parser.add_argument('--version', action='version', version=version_text)
+    :param data_list: list of dictionaries that contain the data to be loaded
+    :param output_file: output CSV file
+    :param field_list: (optional) list of fields to output to CSV file
+    :return: None
+    """
+
+    if not field_list:
+        # get the fields present in the dicts
+        field_summary = collections.Counter()
+        data_list = list(data_list)
+        for item in data_list:
+            field_summary.update(item.keys())
+        field_list = [field_key for field_key in field_summary]
+
+    writer = csv.writer(output_file, lineterminator="\n")
+    writer.writerow(field_list)
+    # fields missing from a dict are written as empty values, fields not in field_list are ignored
+    no_values = itertools.repeat('')
+    writer.writerows(map(data_item.get, field_list, no_values) for data_item in data_list)
 
 
 def get_config(config_filename, envvar='CARDUTIL_CONFIG', cli_filename=None):
@@ -41,9 +73,7 @@ def get_config(config_filename, envvar='CARDUTIL_CONFIG', cli_filename=None):
     if cli_filename:
         if os.path.isfile(cli_filename):
             LOGGER.info('Using cli config at {}'.format(cli_filename))
-            with open(cli_filename, 'r') as f:
-                config = f.read()
-            return json.loads(config)
+            return _load_json(cli_filename, os.path.getmtime(cli_filename))
 
     # check for json config file from ENVVAR directory
     config_dir = os.environ.get(envvar)
@@ -54,9 +84,18 @@ def get_config(config_filename, envvar='CARDUTIL_CONFIG', cli_filename=None):
         if os.path.isfile(os.path.join(config_dir, config_filename)):
             LOGGER.info('Using config at {}'.format(config_dir))
             config_filename = os.path.join(config_dir, config_filename)
-            with open(config_filename, 'r') as f:
-                config = f.read()
-            return json.loads(config)
+            return _load_json(config_filename, os.path.getmtime(config_filename))
 
     # Use package config
     return pkg_config
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json(filename, mtime):
+    """
+    Load JSON config file. Results are cached by filename and modification time
+    so the file is only parsed again if it changes.
+    """
+    with open(filename, 'r') as f:
+        config = f.read()
+    return json.loads(config)
@@ -1,9 +1,8 @@
 import argparse
+import csv
 import logging
-from csv import DictReader
 
-from cardutil.cli import add_version, get_config, print_banner
-from cardutil.mciipm import IpmWriter
+from cardutil.cli import IO_BUFFER_SIZE, add_version, get_config, print_banner
 
 
 def cli_entry():
@@ -21,9 +20,9 @@ def cli_run(**kwargs):
     if not kwargs.get('out_filename'):
         kwargs['out_filename'] = kwargs['in_filename'] + '.ipm'
 
-    with open(kwargs['in_filename'], 'r', encoding=kwargs.get('in_encoding')) as in_csv:
-        with open(kwargs['out_filename'], 'wb') as out_ipm:
-            mci_csv_to_ipm(in_csv=in_csv, out_ipm=out_ipm, config=config, **kwargs)
+    with open(kwargs['in_filename'], 'r', encoding=kwargs.get('in_encoding'), buffering=IO_BUFFER_SIZE) as in_csv, \
+            open(kwargs['out_filename'], 'wb', buffering=IO_BUFFER_SIZE) as out_ipm:
+        mci_csv_to_ipm(in_csv=in_csv, out_ipm=out_ipm, config=config, **kwargs)
 
 
 def cli_parser():
@@ -51,12 +50,13 @@ def mci_csv_to_ipm(in_csv, out_ipm, config, out_encoding=None, no1014blocking=Fa
     :param no1014blocking: set True 1014 blocking not required
     :return: None
     """
+    from cardutil.mciipm import IpmWriter
+
     blocked = not no1014blocking
     with IpmWriter(out_ipm, encoding=out_encoding, blocked=blocked, iso_config=config.get('bit_config')) as writer:
-        reader = DictReader(in_csv)
-        for row in reader:
-            record = {k: v for k, v in row.items() if v}
-            writer.write(record)
+        reader = csv.reader(in_csv)
+        header = next(reader, [])
+        writer.write_many({k: v for k, v in zip(header, row) if v} for row in reader if row)
 
 
 if __name__ == '__main__':
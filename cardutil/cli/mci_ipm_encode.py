@@ -1,10 +1,11 @@
 import argparse
+import codecs
 import copy
 import logging
+import shutil
 
 import cardutil.config
-from cardutil.cli import add_version, print_banner
-from cardutil.mciipm import IpmReader, IpmWriter
+from cardutil.cli import IO_BUFFER_SIZE, add_version, print_banner
 
 
 def cli_entry():
@@ -24,7 +25,8 @@ def cli_run(**kwargs):
     if kwargs.get('no1014blocking'):
         kwargs['in_format'] = kwargs['out_format'] = 'vbs'
 
-    with open(kwargs['in_filename'], 'rb') as in_file, open(kwargs['out_filename'], 'wb') as out_file:
+    with open(kwargs['in_filename'], 'rb', buffering=IO_BUFFER_SIZE) as in_file, \
+            open(kwargs['out_filename'], 'wb', buffering=IO_BUFFER_SIZE) as out_file:
         mci_ipm_encode(in_file, out_file=out_file, **kwargs)
 
 
@@ -69,8 +71,29 @@ def mci_ipm_encode(in_file, out_file=None, in_encoding='cp500', out_encoding='la
     :return: None
     """
 
+    from cardutil.iso8583 import DEFAULT_ENCODING
+    from cardutil.mciipm import IpmReader, IpmWriter, VbsReader, VbsWriter, get_translate_table, translate_ipm_records
+
+    in_encoding = in_encoding or DEFAULT_ENCODING
+    out_encoding = out_encoding or DEFAULT_ENCODING
     in_blocked = True if in_format == '1014' else False
     out_blocked = True if out_format == '1014' else False
+
+    # nothing to change, just copy the file
+    if in_format == out_format and codecs.lookup(in_encoding).name == codecs.lookup(out_encoding).name:
+        shutil.copyfileobj(in_file, out_file, IO_BUFFER_SIZE)
+        out_file.seek(0)
+        return
+
+    # single byte encodings can be translated without parsing the records
+    translate_table = get_translate_table(in_encoding, out_encoding)
+    if translate_table:
+        with VbsWriter(out_file, blocked=out_blocked) as writer:
+            reader = VbsReader(in_file, blocked=in_blocked)
+            writer.write_many(translate_ipm_records(reader, translate_table, encoding=in_encoding,
+                                                    iso_config=get_config()))
+        return
+
     with IpmWriter(out_file, encoding=out_encoding, blocked=out_blocked) as writer:
         reader = IpmReader(in_file, encoding=in_encoding, blocked=in_blocked, iso_config=get_config())
         writer.write_many(reader)
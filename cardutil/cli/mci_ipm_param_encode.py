@@ -1,8 +1,9 @@
 import argparse
+import codecs
 import logging
+import shutil
 
-from cardutil.cli import add_version, print_banner
-from cardutil.mciipm import VbsReader, VbsWriter
+from cardutil.cli import IO_BUFFER_SIZE, add_version, print_banner
 
 
 def cli_entry():
@@ -22,7 +23,8 @@ def cli_run(**kwargs):
     if kwargs.get('no1014blocking'):
         kwargs['in_format'] = kwargs['out_format'] = 'vbs'
 
-    with open(kwargs['in_filename'], 'rb') as in_file, open(kwargs['out_filename'], 'wb') as out_file:
+    with open(kwargs['in_filename'], 'rb', buffering=IO_BUFFER_SIZE) as in_file, \
+            open(kwargs['out_filename'], 'wb', buffering=IO_BUFFER_SIZE) as out_file:
         mci_ipm_param_encode(in_file, out_file=out_file, **kwargs)
 
 
@@ -55,16 +57,23 @@ def mci_ipm_param_encode(in_file, out_file, in_encoding=None, out_encoding=None,
     :param out_format: output file format (vbs/1014)
     :return: None
     """
+    from cardutil.mciipm import VbsReader, VbsWriter, transcode_records
+
     if not in_encoding:
         in_encoding = 'latin_1'
     if not out_encoding:
         out_encoding = in_encoding
 
+    # nothing to change, just copy the file
+    if in_format == out_format and codecs.lookup(in_encoding).name == codecs.lookup(out_encoding).name:
+        shutil.copyfileobj(in_file, out_file, IO_BUFFER_SIZE)
+        out_file.seek(0)
+        return
+
     in_blocked = True if in_format == '1014' else False
     vbs_reader = VbsReader(in_file, blocked=in_blocked)
 
-    in_records = (record.decode(in_encoding) for record in vbs_reader)
-    out_records = (record.encode(out_encoding) for record in in_records)
+    out_records = transcode_records(vbs_reader, in_encoding, out_encoding)
     out_blocked = True if out_format == '1014' else False
     with VbsWriter(out_file, blocked=out_blocked) as vbs_writer:
         vbs_writer.write_many(out_records)
@@ -1,9 +1,10 @@
 import argparse
 import csv
+import io
 import logging
+import operator
 
-from cardutil.cli import add_version, get_config, print_banner
-from cardutil import mciipm
+from cardutil.cli import IO_BUFFER_SIZE, add_version, get_config, print_banner
 
 
 def cli_entry():
@@ -22,9 +23,10 @@ def cli_run(**kwargs):
     if not kwargs.get('out_filename'):
         kwargs['out_filename'] = kwargs['in_filename'] + '_' + kwargs['table_id'] + '.csv'
 
-    with open(kwargs['in_filename'], 'rb') as in_ipm:
-        with open(kwargs['out_filename'], 'w', encoding=kwargs.get('out_encoding')) as out_csv:
-            mci_ipm_param_to_csv(in_param=in_ipm, out_csv=out_csv, config=param_config, **kwargs)
+    with open(kwargs['in_filename'], 'rb', buffering=IO_BUFFER_SIZE) as in_ipm, \
+            open(kwargs['out_filename'], 'w', encoding=kwargs.get('out_encoding'),
+                 buffering=IO_BUFFER_SIZE) as out_csv:
+        mci_ipm_param_to_csv(in_param=in_ipm, out_csv=out_csv, config=param_config, **kwargs)
 
 
 def cli_parser():
@@ -57,6 +59,8 @@ def mci_ipm_param_to_csv(
     expanded=False,
     **_
 ):
+    from cardutil import mciipm
+
     blocked = not no1014blocking
     vbs_in = mciipm.IpmParamReader(
         in_param,
@@ -68,11 +72,38 @@ def mci_ipm_param_to_csv(
     )
     fieldnames = ["table_id", "effective_timestamp", "active_inactive_code"]
     fieldnames.extend(config[table_id].keys())
-    csv_writer = csv.DictWriter(
-        out_csv, fieldnames=fieldnames, extrasaction="ignore", lineterminator="\n"
-    )
-    csv_writer.writeheader()
-    csv_writer.writerows(vbs_in)
+    csv_writer = csv.writer(out_csv, lineterminator="\n")
+    csv_writer.writerow(fieldnames)
+    out_csv.writelines(map(_get_csv_line_formatter(fieldnames), vbs_in))
+
+
+def _get_csv_line_formatter(fieldnames):
+    """
+    Create a function that formats a parameter record as a CSV line.
+
+    Parameter records rarely contain characters that need CSV quoting, so lines are
+    built with a simple join and only passed through the csv module when quoting is needed.
+
+    :param fieldnames: the field names in output order
+    :return: function taking a record dict and returning the CSV line
+    """
+    # reader records always contain every field, so extract the row values in field order
+    get_values = operator.itemgetter(*fieldnames)
+    delimiter_count = len(fieldnames) - 1
+    line_buffer = io.StringIO()
+    line_writer = csv.writer(line_buffer, lineterminator="\n")
+
+    def format_line(record):
+        values = get_values(record)
+        line = ",".join(values)
+        if line.count(",") == delimiter_count and not ('"' in line or "\n" in line or "\r" in line):
+            return line + "\n"
+        line_buffer.seek(0)
+        line_buffer.truncate()
+        line_writer.writerow(values)
+        return line_buffer.getvalue()
+
+    return format_line
 
 
 if __name__ == '__main__':
@@ -1,10 +1,7 @@
 import argparse
-import collections
-import csv
 import logging
 
-from cardutil.cli import add_version, get_config, print_banner, print_exception_details
-from cardutil.mciipm import IpmReader, MciIpmDataError, ipm_info
+from cardutil.cli import IO_BUFFER_SIZE, add_version, dicts_to_csv, get_config, print_banner, print_exception_details
 
 
 def cli_entry():
@@ -27,6 +24,7 @@ def print_check_details(in_ipm_info):
 
 
 def cli_run(**kwargs):
+    from cardutil.mciipm import MciIpmDataError, ipm_info
 
     print_banner('mci_ipm_to_csv', kwargs)
 
@@ -38,47 +36,18 @@ def cli_run(**kwargs):
     if not kwargs.get('out_filename'):
         kwargs['out_filename'] = kwargs['in_filename'] + '.csv'
 
-    # check ipm details
-    with open(kwargs['in_filename'], 'rb') as in_ipm:
+    with open(kwargs['in_filename'], 'rb', buffering=IO_BUFFER_SIZE) as in_ipm, \
+            open(kwargs['out_filename'], 'w', encoding=kwargs.get('out_encoding'),
+                 buffering=IO_BUFFER_SIZE) as out_csv:
+        # check ipm details, then rewind to process the file
         in_ipm_info = ipm_info(in_ipm)
-
-    try:
-        with open(kwargs['in_filename'], 'rb') as in_ipm:
-            with open(kwargs['out_filename'], 'w', encoding=kwargs.get('out_encoding')) as out_csv:
-                mci_ipm_to_csv(in_ipm=in_ipm, out_csv=out_csv, config=config, **kwargs)
-    except MciIpmDataError as err:
-        print_exception_details(err)
-        print_check_details(in_ipm_info)
-        return -1
-
-
-def dicts_to_csv(data_list, output_file, field_list=None):
-    """
-    Writes dict data to CSV file
-
-    :param data_list: list of dictionaries that contain the data to be loaded
-    :param output_file: output CSV file
-    :param field_list: (optional) list of fields to output to CSV file
-    :return: None
-    """
-
-    if not field_list:
-        # get the fields present in the dicts
-        field_summary = collections.Counter()
-        data_list = list(data_list)
-        for item in data_list:
-            field_summary.update(item.keys())
-        field_list = [field_key for field_key in field_summary]
-
-    writer = csv.DictWriter(
-        output_file,
-        fieldnames=field_list,
-        extrasaction="ignore",
-        lineterminator="\n")
-
-    writer.writeheader()
-    for data_item in data_list:
-        writer.writerow({item: data_item[item] for item in data_item if item in field_list})
+        in_ipm.seek(0)
+        try:
+            mci_ipm_to_csv(in_ipm=in_ipm, out_csv=out_csv, config=config, **kwargs)
+        except MciIpmDataError as err:
+            print_exception_details(err)
+            print_check_details(in_ipm_info)
+            return -1
 
 
 def cli_parser():
@@ -106,6 +75,8 @@ def mci_ipm_to_csv(in_ipm, out_csv, config, in_encoding=None, no1014blocking=Fal
     :param no1014blocking: set True if no 1014 blocking used
     :return: None
     """
+    from cardutil.mciipm import IpmReader
+
     blocked = not no1014blocking
     dicts_to_csv(
         IpmReader(in_ipm, encoding=in_encoding, blocked=blocked, iso_config=config.get('bit_config')),
@@ -1,11 +1,8 @@
 import argparse
-import collections
-import csv
 import logging
 
 from cardutil import __version__
-from cardutil.cli import get_config, print_banner, print_exception_details
-from cardutil.mciipm import IpmReader, IpmWriter, MciIpmDataError
+from cardutil.cli import IO_BUFFER_SIZE, dicts_to_csv, get_config, print_banner, print_exception_details
 
 
 def cli_entry(*args):
@@ -13,6 +10,7 @@ def cli_entry(*args):
 
 
 def cli_run(**kwargs):
+    from cardutil.mciipm import MciIpmDataError
 
     print_banner('mideu', kwargs)
     if not len(kwargs):
@@ -33,35 +31,6 @@ def cli_run(**kwargs):
         return -1
 
 
-def dicts_to_csv(data_list, output_file, field_list=None):
-    """
-    Writes dict data to CSV file
-
-    :param data_list: list of dictionaries that contain the data to be loaded
-    :param output_file: output CSV file
-    :param field_list: (optional) list of fields to output to CSV file
-    :return: None
-    """
-
-    if not field_list:
-        # get the fields present in the dicts
-        field_summary = collections.Counter()
-        data_list = list(data_list)
-        for item in data_list:
-            field_summary.update(item.keys())
-        field_list = [field_key for field_key in field_summary]
-
-    writer = csv.DictWriter(
-        output_file,
-        fieldnames=field_list,
-        extrasaction="ignore",
-        lineterminator="\n")
-
-    writer.writeheader()
-    for data_item in data_list:
-        writer.writerow({item: data_item[item] for item in data_item if item in field_list})
-
-
 def _get_cli_parser():
     """
     mideu argparse parser create
@@ -160,6 +129,8 @@ def extract(config, **kwargs):
     :param config: dict containing cardutil config
     :return: None
     """
+    from cardutil.mciipm import IpmReader
+
     blocked = not kwargs.get('no1014blocking', False)
     kwargs['out_encoding'] = 'utf8'
     if kwargs.get('sourceformat', 'ebcdic') == 'ebcdic':
@@ -169,11 +140,12 @@ def extract(config, **kwargs):
     if not kwargs.get('csvoutputfile'):
         kwargs['csvoutputfile'] = kwargs['input'] + '.csv'
 
-    with open(kwargs['input'], 'rb') as in_ipm:
-        with open(kwargs['csvoutputfile'], 'w', encoding=kwargs.get('out_encoding')) as out_csv:
-            dicts_to_csv(
-                IpmReader(in_ipm, encoding=kwargs['in_encoding'], blocked=blocked, iso_config=config.get('bit_config')),
-                out_csv, field_list=config.get('output_data_elements'))
+    with open(kwargs['input'], 'rb', buffering=IO_BUFFER_SIZE) as in_ipm, \
+            open(kwargs['csvoutputfile'], 'w', encoding=kwargs.get('out_encoding'),
+                 buffering=IO_BUFFER_SIZE) as out_csv:
+        dicts_to_csv(
+            IpmReader(in_ipm, encoding=kwargs['in_encoding'], blocked=blocked, iso_config=config.get('bit_config')),
+            out_csv, field_list=config.get('output_data_elements'))
 
 
 def convert(config, **kwargs):
@@ -182,6 +154,8 @@ def convert(config, **kwargs):
 
     :return: None
     """
+    from cardutil.mciipm import VbsReader, VbsWriter, get_translate_table, translate_ipm_records
+
     in_filename = kwargs['input']
     out_filename = in_filename + '.out'
     in_blocked = not kwargs.get('no1014blocking', False)
@@ -193,8 +167,10 @@ def convert(config, **kwargs):
         in_encoding = 'latin1'
         out_encoding = 'cp500'
 
-    with open(in_filename, 'rb') as in_file:
-        with open(out_filename, 'wb') as out_file:
-            with IpmWriter(out_file, encoding=out_encoding, blocked=in_blocked) as writer:
-                reader = IpmReader(in_file, encoding=in_encoding, blocked=out_blocked)
-                writer.write_many(reader)
+    with open(in_filename, 'rb', buffering=IO_BUFFER_SIZE) as in_file, \
+            open(out_filename, 'wb', buffering=IO_BUFFER_SIZE) as out_file:
+        # cp500 and latin1 map byte for byte, so records are translated without parsing to dict
+        translate_table = get_translate_table(in_encoding, out_encoding)
+        with VbsWriter(out_file, blocked=out_blocked) as writer:
+            reader = VbsReader(in_file, blocked=in_blocked)
+            writer.write_many(translate_ipm_records(reader, translate_table, encoding=in_encoding))
@@ -1,10 +1,11 @@
 import argparse
+import codecs
 import logging
+import shutil
 
 from cardutil import __version__
-from cardutil.cli import print_banner, print_exception_details
+from cardutil.cli import IO_BUFFER_SIZE, print_banner, print_exception_details
 from cardutil.cli.mideu import add_logging_arg_group, add_source_format_arg
-from cardutil.mciipm import MciIpmDataError, VbsReader, VbsWriter
 
 
 def cli_entry(*args):
@@ -12,6 +13,7 @@ def cli_entry(*args):
 
 
 def cli_run(**kwargs):
+    from cardutil.mciipm import MciIpmDataError
 
     print_banner('paramconv', kwargs)
     if not len(kwargs):
@@ -35,7 +37,8 @@ def cli_run(**kwargs):
         out_encoding = 'cp500'
 
     try:
-        with open(kwargs['input'], 'rb') as in_file, open(out_filename, 'wb') as out_file:
+        with open(kwargs['input'], 'rb', buffering=IO_BUFFER_SIZE) as in_file, \
+                open(out_filename, 'wb', buffering=IO_BUFFER_SIZE) as out_file:
             mci_ipm_param_encode(
                 in_file, out_file=out_file, blocked=blocked,
                 in_encoding=in_encoding, out_encoding=out_encoding)
@@ -74,10 +77,17 @@ def mci_ipm_param_encode(in_file, out_file, in_encoding, out_encoding, blocked):
     :param blocked: 1014 blocked = True, VBS = False
     :return: None
     """
+    from cardutil.mciipm import VbsReader, VbsWriter, transcode_records
+
+    # nothing to change, just copy the file
+    if codecs.lookup(in_encoding).name == codecs.lookup(out_encoding).name:
+        shutil.copyfileobj(in_file, out_file, IO_BUFFER_SIZE)
+        out_file.seek(0)
+        return
+
     vbs_reader = VbsReader(in_file, blocked=blocked)
 
-    in_records = (record.decode(in_encoding) for record in vbs_reader)
-    out_records = (record.encode(out_encoding) for record in in_records)
+    out_records = transcode_records(vbs_reader, in_encoding, out_encoding)
 
     with VbsWriter(out_file, blocked=blocked) as vbs_writer:
         vbs_writer.write_many(out_records)
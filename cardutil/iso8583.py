@@ -60,17 +60,24 @@ Set **hex_bitmap** to True if you require a hex format bitmap::
     >>> message_dict
     {'MTI': '1144', 'DE2': '4444555566667777'}
 
+The field settings in an **iso_config** dictionary are prepared the first time the dictionary is used
+and reused after that. Bits added to or removed from the dictionary are picked up automatically.
+If you change the settings of a bit that is already in the dictionary, call
+:py:func:`clear_bit_table_cache` afterwards, or pass a new config dictionary.
+
 """
 import binascii
 import datetime
 import decimal
+import functools
 import logging
 import re
 import struct
 import sys
+import typing
 
 from cardutil import CardutilError
-from cardutil.BitArray import BitArray
+from cardutil.BitArray import BitArray, bitmap_bits  # noqa: F401 BitArray is re-exported for existing imports
 from cardutil.card import mask
 from cardutil.config import config
 from cardutil.vendor.hexdump import hexdump
@@ -78,11 +85,59 @@ from cardutil.vendor.hexdump import hexdump
 LOGGER = logging.getLogger(__name__)
 DEFAULT_ENCODING = 'latin_1'
 
+# bit tables built by _get_bit_table_entry, keyed by the id of the source bit config
+_bit_tables = dict()
+_BIT_TABLES_MAX = 16
+
+# message dictionary keys for each bit number
+_DE_KEYS = tuple(sys.intern('DE' + str(bit)) for bit in range(129))
+
+# bit numbers of the message dictionary keys written by dumps (bits 2 to 127)
+_DE_BITS = {_DE_KEYS[bit]: bit for bit in range(2, 128)}
+
+# names of the latin_1 encoding, where the encoded digits are ascii
+_LATIN_1_ENCODINGS = frozenset(('latin_1', 'latin-1', 'latin1', 'iso8859-1', 'iso-8859-1'))
+
+# message type indicator and bitmap at the start of every message
+_BINARY_BITMAP_HEADER = struct.Struct("4s16s")
+_HEX_BITMAP_HEADER = struct.Struct("4s32s")
+
+# length of an EMV tag id indexed by its first byte, tags starting 9F or 5F are two bytes
+_ICC_TAG_LENGTHS = bytes(2 if first_byte in (0x9f, 0x5f) else 1 for first_byte in range(256))
+
+# two digit date format directives and their datetime argument position
+_DATE_DIRECTIVES = {'%y': 0, '%m': 1, '%d': 2, '%H': 3, '%M': 4, '%S': 5}
+
 
 class Iso8583DataError(CardutilError):
     pass
 
 
+class _FieldConfig(typing.NamedTuple):
+    """
+    Settings read for every field when parsing messages, taken once from the bit config dictionary.
+    field_key is the interned output dictionary key for the bit (DEx).
+    """
+    bit_config: dict
+    field_key: str
+    field_length: int
+    length_size: int
+    field_processor: str
+    field_formatter: typing.Optional[typing.Callable]
+    field_converter: typing.Optional[typing.Callable]
+
+    @classmethod
+    def from_bit_config(cls, bit, bit_config):
+        return cls(
+            bit_config,
+            sys.intern('DE' + str(bit)),
+            bit_config.get('field_length', 0),
+            _get_field_length(bit_config),
+            bit_config.get('field_processor'),
+            _FIELD_FORMATTERS.get(bit_config.get('field_processor')),
+            _get_string_converter(bit_config))
+
+
 def dumps(obj: dict, encoding=None, iso_config=None, hex_bitmap=False):
     """
     Serialize obj to a ISO8583 message byte string
@@ -134,6 +189,83 @@ def loads(b: bytes, encoding=None, iso_config=None, hex_bitmap=False):
     return _iso8583_to_dict(b, iso_config, encoding, hex_bitmap)
 
 
+def clear_bit_table_cache():
+    """
+    Clear the field settings prepared from iso_config dictionaries
+
+    Call after changing the settings of a bit in a config dictionary that has already been used,
+    so the next call using the dictionary picks up the change.
+
+    :return: None
+    """
+    _bit_tables.clear()
+
+
+def translate(b: bytes, translate_table: bytes, encoding=None, iso_config=None):
+    """
+    Convert an ISO8583 message from one single byte encoding to another without parsing the fields
+    to python objects.
+
+    The MTI, field lengths and field data are translated using ``bytes.translate``.
+    The bitmap and ICC fields are binary so are copied unchanged.
+
+    :param b: bytes containing message
+    :param translate_table: 256 byte translation table, see :py:func:`cardutil.mciipm.get_translate_table`
+    :param encoding: python text encoding scheme of the input message
+    :param iso_config: iso8583 message configuration dictionary
+    :return: byte string containing the translated message
+    """
+    if not encoding:
+        encoding = DEFAULT_ENCODING
+    if not iso_config:
+        iso_config = config['bit_config']
+
+    message_type_indicator, binary_bitmap = b[:4], b[4:20]
+    if len(binary_bitmap) != 16:
+        raise Iso8583DataError('Failed unpacking bitmap values', binary_context_data=b)
+    try:
+        int(message_type_indicator.decode(encoding))  # check that mti is number
+    except (ValueError, UnicodeError) as ex:
+        raise Iso8583DataError('Failed decoding MTI field', binary_context_data=b, original_exception=ex)
+
+    output = [message_type_indicator.translate(translate_table), binary_bitmap]
+    message_pointer = 20
+    bit_table = _get_bit_table(iso_config)
+
+    for bit in bitmap_bits(binary_bitmap):
+        if 1 < bit < 128:
+            bit_config = bit_table[bit]
+            if not bit_config:
+                raise Iso8583DataError(f'No bit config available for bit {bit}', binary_context_data=b)
+
+            field_length = bit_config.field_length
+            length_size = bit_config.length_size
+            if length_size > 0:
+                try:
+                    field_length = int(b[message_pointer:message_pointer + length_size].decode(encoding))
+                except (ValueError, UnicodeError) as ex:
+                    raise Iso8583DataError(f'Invalid field length DE{bit}',
+                                           binary_context_data=b, original_exception=ex)
+
+            field_end = message_pointer + length_size + field_length
+            if bit_config.field_processor == 'ICC':
+                output.append(b[message_pointer:message_pointer + length_size].translate(translate_table))
+                output.append(b[message_pointer + length_size:field_end])
+            else:
+                output.append(b[message_pointer:field_end].translate(translate_table))
+            message_pointer = field_end
+
+    # check that all of message has been consumed, otherwise raise exception
+    if message_pointer != len(b):
+        raise Iso8583DataError(
+            f'Message data not correct length. '
+            f'Bitmap indicates len={message_pointer - 20}, message is len={len(b) - 20}',
+            binary_context_data=b
+        )
+
+    return b''.join(output)
+
+
 def _iso8583_to_dict(message, bit_config, encoding=DEFAULT_ENCODING, hex_bitmap=False):
     """
     Convert ISO8583 style message to dictionary
@@ -157,21 +289,20 @@ def _iso8583_to_dict(message, bit_config, encoding=DEFAULT_ENCODING, hex_bitmap=
     * key = 'TAGxxxx' icc fields
 
     """
-    LOGGER.debug("Processing message: len=%s contents:\n%s", len(message), hexdump(message, result="return"))
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug("Processing message: len=%s contents:\n%s", len(message), hexdump(message, result="return"))
     # split raw message into components MessageType(4B), Bitmap(16B),
     # Message(l=*)
 
     try:
         if hex_bitmap:
-            message_length = len(message)-36
-            message_type_indicator, bitmap, message_data = struct.unpack(
-                "4s32s" + str(message_length) + "s", message)
+            message_type_indicator, bitmap = _HEX_BITMAP_HEADER.unpack_from(message)
+            message_data = message[_HEX_BITMAP_HEADER.size:]
             binary_bitmap = binascii.unhexlify(bitmap)
 
         else:
-            message_length = len(message)-20
-            message_type_indicator, binary_bitmap, message_data = struct.unpack(
-                "4s16s" + str(message_length) + "s", message)
+            message_type_indicator, binary_bitmap = _BINARY_BITMAP_HEADER.unpack_from(message)
+            message_data = message[_BINARY_BITMAP_HEADER.size:]
     except struct.error as ex:
         raise Iso8583DataError('Failed unpacking bitmap values', binary_context_data=message, original_exception=ex)
     return_values = dict()
@@ -183,13 +314,14 @@ def _iso8583_to_dict(message, bit_config, encoding=DEFAULT_ENCODING, hex_bitmap=
     except (ValueError, UnicodeError) as ex:
         raise Iso8583DataError('Failed decoding MTI field', binary_context_data=message, original_exception=ex)
     message_pointer = 0
-    bitmap_list = _get_bitmap_list(binary_bitmap)
+    bit_table = _get_bit_table(bit_config)
 
-    for bit in range(2, 128):
-        if bitmap_list[bit]:
+    # bit 1 indicates the secondary bitmap and has no field data
+    for bit in bitmap_bits(binary_bitmap):
+        if 1 < bit < 128:
             LOGGER.debug("processing bit %s", bit)
             # Check that config is available for this bit
-            if not bit_config.get(str(bit)):
+            if not bit_table[bit]:
                 raise Iso8583DataError(
                     f'No bit config available for bit {bit}',
                     binary_context_data=message
@@ -197,9 +329,10 @@ def _iso8583_to_dict(message, bit_config, encoding=DEFAULT_ENCODING, hex_bitmap=
 
             return_message, message_increment = _iso8583_to_field(
                 bit,
-                bit_config[str(bit)],
-                message_data[message_pointer:],
-                encoding)
+                bit_table[bit],
+                message_data,
+                encoding,
+                message_pointer)
 
             # Increment the message pointer and process next field
             message_pointer += message_increment
@@ -233,124 +366,166 @@ def _dict_to_iso8583(message, bit_config, encoding=DEFAULT_ENCODING, hex_bitmap=
     * Message data - Remainder of record
 
     """
-    output_data = b''
-    bitmap_values = [False] * 128
-    bitmap_values[0] = True  # set bit 1 on for presence of bitmap
+    output_data = []
+    bitmap_value = 1 << 127  # set bit 1 on for presence of bitmap
 
     # get the pds fields from config
-    de_pds_fields = sorted(
-        [int(key) for key in bit_config if bit_config[key].get('field_processor') == 'PDS'], reverse=True)
+    de_pds_fields = list(_get_pds_bits(bit_config))
     LOGGER.debug(de_pds_fields)
 
     for de_field_value in _pds_to_de(message):
         de_field_key = de_pds_fields.pop()
-        LOGGER.debug(f'de{de_field_key}={de_field_value}')
-        message[f'DE{de_field_key}'] = de_field_value
-
-    for bit in range(2, 128):
-        if message.get('DE' + str(bit)) or message.get('DE' + str(bit)) == 0:  # 0 evals to false, allow zero values
-            LOGGER.debug(f'processing bit {bit}')
-            bitmap_values[bit - 1] = True
-            LOGGER.debug(message.get('DE' + str(bit)))
-            output_data += _field_to_iso8583(
+        LOGGER.debug('de%s=%s', de_field_key, de_field_value)
+        message[_DE_KEYS[de_field_key]] = de_field_value
+
+    # only visit the bits that have a key in the message, in bit order
+    for bit in sorted(_DE_BITS[key] for key in message if key in _DE_BITS):
+        field_value = message[_DE_KEYS[bit]]
+        if field_value or field_value == 0:  # 0 evals to false, allow zero values
+            LOGGER.debug('processing bit %s', bit)
+            bitmap_value |= 1 << (128 - bit)
+            LOGGER.debug(field_value)
+            output_data.append(_field_to_iso8583(
                 bit_config[str(bit)],
-                message.get('DE' + str(bit)),
-                encoding=encoding)
+                field_value,
+                encoding=encoding))
 
-    bitarray = BitArray()
-    bitarray.fromlist(bitmap_values)
-    binary_bitmap = bitarray.tobytes()
+    binary_bitmap = bitmap_value.to_bytes(16, 'big')
     if hex_bitmap:
         bitmap = binascii.hexlify(binary_bitmap)
     else:
         bitmap = binary_bitmap
 
     mti = message['MTI'].encode(encoding) if message.get('MTI') else b''
-    output_string = mti + bitmap + output_data
+    output_string = b''.join([mti, bitmap, *output_data])
     return output_string
 
 
 def _field_to_iso8583(bit_config, field_value, encoding=DEFAULT_ENCODING):
 
-    output = b''
-    LOGGER.debug(f'bit_config={bit_config}, field_value={field_value}, encoding={encoding}')
+    length_output = b''
+    LOGGER.debug('bit_config=%s, field_value=%s, encoding=%s', bit_config, field_value, encoding)
     field_value = _pytype_to_string(field_value, bit_config)
     field_length = bit_config.get('field_length')
     length_size = _get_field_length(bit_config)  # size of length for llvar and lllvar fields
 
     if length_size > 0:
         field_length = len(field_value)
-        output += format(field_length, '0' + str(length_size)).encode(encoding)
+        length_prefixes = _get_length_prefixes(length_size, encoding)
+        if field_length < len(length_prefixes):
+            length_output = length_prefixes[field_length]
+        else:
+            length_output = format(field_length, '0' + str(length_size)).encode(encoding)
 
     if isinstance(field_value, bytes):
-        output += field_value[:field_length]
-    else:
-        output += format(field_value[:field_length], '<' + str(field_length)).encode(encoding)
+        return length_output + field_value[:field_length]
+    return length_output + format(field_value[:field_length], '<' + str(field_length)).encode(encoding)
 
-    return output
 
+@functools.lru_cache(maxsize=16)
+def _get_latin_1_table(encoding):
+    """
+    Get a table that translates bytes in a single byte encoding to the same characters in latin_1
+
+    :param encoding: byte encoding
+    :return: 256 byte translate table, or None if the encoding cannot be translated to latin_1
+    """
+    try:
+        characters = bytes(range(256)).decode(encoding)
+        if len(characters) != 256:
+            return None
+        return characters.encode('latin_1')
+    except (UnicodeDecodeError, UnicodeEncodeError):
+        return None
+
+
+@functools.lru_cache(maxsize=16)
+def _get_length_prefixes(length_size, encoding):
+    """
+    Get the encoded length prefixes for variable length fields
 
-def _iso8583_to_field(bit, bit_config, message_data, encoding=DEFAULT_ENCODING):
+    :param length_size: number of digits in the length prefix
+    :param encoding: byte encoding
+    :return: tuple of encoded length prefixes indexed by field length
+    """
+    length_format = '0' + str(length_size)
+    return tuple(format(field_length, length_format).encode(encoding) for field_length in range(10 ** length_size))
+
+
+def _iso8583_to_field(bit, bit_config, message_data, encoding=DEFAULT_ENCODING, field_pointer=0):
     """
     Processes a message bit element
 
     :param bit: DE bit
-    :param bit_config: message bit configuration
+    :param bit_config: message bit configuration dictionary or _FieldConfig
     :param message_data: the data to be processed
     :param encoding: byte encoding
+    :param field_pointer: position of the field in message_data
     :returns:
         dictionary: field values
         message incrementer: position of next message
     """
+    if not isinstance(bit_config, _FieldConfig):
+        bit_config = _FieldConfig.from_bit_config(bit, bit_config)
 
-    field_length = bit_config['field_length']
-
-    length_size = _get_field_length(bit_config)
+    field_length = bit_config.field_length
+    length_size = bit_config.length_size
 
     if length_size > 0:
-        field_length_string = message_data[:length_size]
+        field_length_string = message_data[field_pointer:field_pointer + length_size]
         try:
-            field_length_string = field_length_string.decode(encoding)
+            # int reads ascii digit bytes directly, so latin_1 lengths do not need decoding
+            # and other single byte encodings (such as cp500) only need translating to latin_1
+            if encoding not in _LATIN_1_ENCODINGS:
+                latin_1_table = _get_latin_1_table(encoding)
+                if latin_1_table:
+                    field_length_string = field_length_string.translate(latin_1_table)
+                else:
+                    field_length_string = field_length_string.decode(encoding)
         except UnicodeDecodeError as ex:
             raise Iso8583DataError(f'Unable to decode DE{bit} field length',
-                                   binary_context_data=message_data, original_exception=ex)
+                                   binary_context_data=message_data[field_pointer:], original_exception=ex)
 
         try:
             field_length = int(field_length_string)
         except ValueError as ex:
             raise Iso8583DataError(f'Invalid field length DE{bit}',
-                                   binary_context_data=message_data, original_exception=ex)
+                                   binary_context_data=message_data[field_pointer:], original_exception=ex)
 
-    field_data = message_data[length_size:length_size + field_length]
-    LOGGER.debug(f'field_data={field_data}')
-    field_processor = bit_config.get('field_processor')
+    field_start = field_pointer + length_size
+    field_data = message_data[field_start:field_start + field_length]
+    LOGGER.debug('field_data=%s', field_data)
+    field_processor = bit_config.field_processor
 
     # do ascii conversion except for ICC field
-    if field_processor != 'ICC':
+    # int reads ascii digit bytes directly, so plain latin_1 integer fields are converted without decoding
+    int_from_bytes = bit_config.field_converter is int and not field_processor and encoding in _LATIN_1_ENCODINGS
+    if field_processor != 'ICC' and not int_from_bytes:
         try:
             field_data = field_data.decode(encoding)
         except UnicodeDecodeError as ex:
             raise Iso8583DataError(f'Unable to decode DE{bit} field value',
-                                   binary_context_data=message_data, original_exception=ex)
-
-    # if field is PAN type, mask the card value
-    if field_processor == 'PAN':
-        field_data = mask(field_data)
+                                   binary_context_data=message_data[field_pointer:], original_exception=ex)
 
-    # if field is PAN type, mask the card value
-    if field_processor == 'PAN-PREFIX':
-        field_data = _pan_prefix(field_data)
+    # if field is PAN type, mask or shorten the card value
+    if bit_config.field_formatter:
+        field_data = bit_config.field_formatter(field_data)
 
     # do field conversion to native python type
-    try:
-        field_data = _string_to_pytype(field_data, bit_config)
-    except ValueError as ex:
-        raise Iso8583DataError(f'Unable to convert DE{bit} field to python type',
-                               binary_context_data=message_data, original_exception=ex)
+    if bit_config.field_converter:
+        try:
+            field_data = bit_config.field_converter(field_data)
+        except ValueError as ex:
+            raise Iso8583DataError(f'Unable to convert DE{bit} field to python type',
+                                   binary_context_data=message_data[field_pointer:], original_exception=ex)
     return_values = dict()
 
     # add value to return dictionary
-    return_values["DE" + str(bit)] = field_data
+    return_values[bit_config.field_key] = field_data
+
+    # fields without a processor have no sub fields
+    if not field_processor:
+        return return_values, field_length + length_size
 
     # if a PDS field, break it down again and add to results
     if field_processor == 'PDS':
@@ -358,7 +533,7 @@ def _iso8583_to_field(bit, bit_config, message_data, encoding=DEFAULT_ENCODING):
 
     # if a DE43 field, break in down again and add to results
     if field_processor == 'DE43':
-        processor_config = bit_config.get('field_processor_config')
+        processor_config = bit_config.bit_config.get('field_processor_config')
         return_values.update(_get_de43_fields(field_data, processor_config))
 
     # if ICC field, break into tags
@@ -375,24 +550,28 @@ def _pan_prefix(field_data):
     return field_data[:9]
 
 
-def _string_to_pytype(field_data, bit_config):
+# functions applied to the decoded field value for PAN field processors
+_FIELD_FORMATTERS = {'PAN': mask, 'PAN-PREFIX': _pan_prefix}
+
+
+def _get_string_converter(bit_config):
     """
-    Field conversion to native python type
+    Get the function that converts field strings to the native python type
 
-    :param field_data: Data to be converted
     :param bit_config: Configuration for bit
-    :return: data in required type
+    :return: function taking the field string and returning the required type,
+        or None if no conversion is required
     """
     field_python_type = bit_config.get('field_python_type')
     field_date_format = bit_config.get('field_date_format', "%y%m%d")
 
     if field_python_type in ("int", "long"):
-        field_data = int(field_data)
+        return int
     if field_python_type == "decimal":
-        field_data = decimal.Decimal(field_data)
+        return decimal.Decimal
     if field_python_type == "datetime":
-        field_data = datetime.datetime.strptime(field_data, field_date_format)
-    return field_data
+        return functools.partial(_string_to_datetime, field_date_format=field_date_format)
+    return None
 
 
 def _pytype_to_string(field_data, bit_config):
@@ -404,18 +583,63 @@ def _pytype_to_string(field_data, bit_config):
     :return: data in required type
     """
     field_python_type = bit_config.get('field_python_type')
-    field_date_format = bit_config.get('field_date_format', "%y%m%d")
 
-    return_string = field_data
+    if not field_python_type or field_python_type == 'string':
+        return field_data
     if field_python_type in ('int', 'long'):
-        return_string = format(int(field_data), '0' + str(bit_config.get('field_length', 0)) + 'd')
+        return format(int(field_data), '0' + str(bit_config.get('field_length', 0)) + 'd')
     if field_python_type == "decimal":
-        return_string = format(decimal.Decimal(field_data), '0' + str(bit_config.get('field_length', 0)) + 'f')
+        return format(decimal.Decimal(field_data), '0' + str(bit_config.get('field_length', 0)) + 'f')
     if field_python_type == "datetime":
         if not isinstance(field_data, datetime.datetime):
             field_data = _get_date_from_string(field_data)
-        return_string = format(field_data, field_date_format)
-    return return_string
+        return format(field_data, bit_config.get('field_date_format', "%y%m%d"))
+    return field_data
+
+
+@functools.lru_cache(maxsize=16)
+def _get_date_slices(field_date_format):
+    """
+    Get the slices of the year, month, day, hour, minute and second digits for a date format
+
+    Only formats made up of two digit directives that include the year, month and day are supported.
+
+    :param field_date_format: strptime date format
+    :return: tuple of field data slices, empty slices for time parts not in the format,
+        or None if the format is not supported
+    """
+    directives = [field_date_format[index:index + 2] for index in range(0, len(field_date_format), 2)]
+    if (any(directive not in _DATE_DIRECTIVES for directive in directives)
+            or len(set(directives)) != len(directives)
+            or not {'%y', '%m', '%d'}.issubset(directives)):
+        return None
+
+    date_slices = [slice(0, 0)] * len(_DATE_DIRECTIVES)
+    for index, directive in enumerate(directives):
+        date_slices[_DATE_DIRECTIVES[directive]] = slice(index * 2, index * 2 + 2)
+    return tuple(date_slices)
+
+
+def _string_to_datetime(field_data, field_date_format):
+    """
+    Convert a date string to a datetime using the field date format
+
+    Fixed width dates of digits are converted directly, giving the same result as strptime
+    without running the strptime parser for every field.
+
+    :param field_data: date string
+    :param field_date_format: strptime date format
+    :return: datetime object
+    """
+    date_slices = _get_date_slices(field_date_format)
+    if (not date_slices or len(field_data) != len(field_date_format)
+            or not (field_data.isascii() and field_data.isdigit())):
+        return datetime.datetime.strptime(field_data, field_date_format)
+
+    year, month, day, hour, minute, second = [int(field_data[date_slice] or 0) for date_slice in date_slices]
+    # same century rule as strptime %y, 69-99 are 1969-1999 and 00-68 are 2000-2068
+    year += 1900 if year >= 69 else 2000
+    return datetime.datetime(year, month, day, hour, minute, second)
 
 
 def _get_date_from_string(field_data: str) -> datetime:
@@ -426,12 +650,10 @@ def _get_date_from_string(field_data: str) -> datetime:
     :param field_data: string containing date
     :return: datetime object
     """
-    try:
-        import dateutil.parser as parser
+    dateutil_parser = _get_dateutil_parser()
+    if dateutil_parser:
         LOGGER.debug('Using dateutil parser')
-        return parser.parse(field_data)
-    except ImportError:
-        pass
+        return dateutil_parser.parse(field_data)
 
     if sys.version_info >= (3, 7):
         LOGGER.debug('Using fromisoformat')
@@ -452,6 +674,20 @@ def _get_date_from_string(field_data: str) -> datetime:
     return output_date
 
 
+@functools.lru_cache(maxsize=None)
+def _get_dateutil_parser():
+    """
+    Get the dateutil parser module, imported on first use
+
+    :return: dateutil.parser module, or None if python-dateutil is not installed
+    """
+    try:
+        import dateutil.parser
+    except ImportError:  # python-dateutil is optional, fall back to fromisoformat
+        return None
+    return dateutil.parser
+
+
 def _get_field_length(bit_config):
     """
     Determine length of iso8583 style field
@@ -461,31 +697,65 @@ def _get_field_length(bit_config):
     """
     length_size = 0
 
-    if bit_config['field_type'] == "LLVAR":
+    field_type = bit_config.get('field_type')
+    if field_type == "LLVAR":
         length_size = 2
-    elif bit_config['field_type'] == "LLLVAR":
+    elif field_type == "LLLVAR":
         length_size = 3
 
     return length_size
 
 
-def _get_bitmap_list(binary_bitmap):
+def _get_bit_table(bit_config):
+    """
+    Get the bit field configs as a tuple indexed by bit number
+
+    The table is built once for each bit config dictionary and reused, so fields are looked
+    up by bit number instead of building and hashing a string key for every field, and field
+    settings are read as attributes instead of dictionary lookups.
+    The table is rebuilt if bits are added to or removed from the bit config. Changes made
+    to the settings of an existing bit require :py:func:`clear_bit_table_cache`.
+
+    :param bit_config: dictionary of bit mapping configuration
+    :return: tuple containing the _FieldConfig for bits 0 to 128, None if the bit has no config
     """
-    Get list of bits from binary bitmap
+    return _get_bit_table_entry(bit_config)[2]
 
-    :param binary_bitmap: the binary bitmap to be returned
-    :return: the list containing bit values. Bit 0 contains original binary bitmap
+
+def _get_pds_bits(bit_config):
+    """
+    Get the bits with the PDS field processor, highest bit first
+
+    Taken from the cached bit table for the bit config.
+
+    :param bit_config: dictionary of bit mapping configuration
+    :return: tuple of bit numbers
     """
-    working_bitmap_list = BitArray(endian='big')
-    working_bitmap_list.frombytes(binary_bitmap)
+    return _get_bit_table_entry(bit_config)[3]
 
-    # Add bit 0 -> original binary bitmap
-    bitmap_list = [binary_bitmap]
 
-    # add bits from bitmap
-    bitmap_list.extend(working_bitmap_list.tolist())
+def _get_bit_table_entry(bit_config):
+    """
+    Get the cached bit table entry for a bit config, building it if required
 
-    return bitmap_list
+    :param bit_config: dictionary of bit mapping configuration
+    :return: tuple of bit config, number of bits in the bit config, bit table and pds bits
+    """
+    cached = _bit_tables.get(id(bit_config))
+    if cached and cached[0] is bit_config and cached[1] == len(bit_config):
+        return cached
+
+    bit_table = tuple(
+        _FieldConfig.from_bit_config(bit, bit_config[str(bit)]) if bit_config.get(str(bit)) else None
+        for bit in range(129))
+    pds_bits = tuple(
+        bit for bit in range(128, -1, -1) if bit_table[bit] and bit_table[bit].field_processor == 'PDS')
+    if len(_bit_tables) >= _BIT_TABLES_MAX:
+        _bit_tables.clear()
+    # keep a reference to the bit config so the id cannot be reused while cached
+    entry = (bit_config, len(bit_config), bit_table, pds_bits)
+    _bit_tables[id(bit_config)] = entry
+    return entry
 
 
 def _pds_to_de(dict_values):
@@ -496,14 +766,14 @@ def _pds_to_de(dict_values):
     :return: list of byte strings containing pds data, or None if no fields
     """
     # get the PDS field keys in order
-    LOGGER.debug(f'dict_values={dict_values}')
+    LOGGER.debug('dict_values=%s', dict_values)
     keys = sorted([key for key in dict_values if key.startswith('PDS')])
-    LOGGER.debug(f'keys={keys}')
+    LOGGER.debug('keys=%s', keys)
     output = ''
     outputs = []
     for key in keys:
         tag = int(key[3:])
-        LOGGER.debug(f'tag={tag}')
+        LOGGER.debug('tag=%s', tag)
         length = len(dict_values[key])
         add_output = f'{tag:04}{length:03}{dict_values[key]}'
         if len(output + add_output) > 999:
@@ -512,7 +782,7 @@ def _pds_to_de(dict_values):
         output += add_output
     if output:
         outputs.append(output)
-    LOGGER.debug(f'>pds2de: {outputs}')
+    LOGGER.debug('>pds2de: %s', outputs)
 
     return outputs
 
@@ -525,20 +795,19 @@ def _pds_to_dict(field_data):
     :return: dictionary of pds key values. Key in the form PDSxxxx where x is zero filled number of pds
     """
     field_pointer = 0
+    field_end = len(field_data)
     return_values = {}
+    debug = LOGGER.isEnabledFor(logging.DEBUG)
 
-    while field_pointer < len(field_data):
-        # get the pds tag id
+    while field_pointer < field_end:
+        # get the pds tag id, length and data
         pds_field_tag = field_data[field_pointer:field_pointer+4]
-        LOGGER.debug("pds_field_tag=[%s]", pds_field_tag)
-
-        # get the pds length
         pds_field_length = int(field_data[field_pointer+4:field_pointer+7])
-        LOGGER.debug("pds_field_length=[%i]", pds_field_length)
-
-        # get the pds data
         pds_field_data = field_data[field_pointer+7:field_pointer+7+pds_field_length]
-        LOGGER.debug("pds_field_data=[%s]", str(pds_field_data))
+        if debug:
+            LOGGER.debug("pds_field_tag=[%s]", pds_field_tag)
+            LOGGER.debug("pds_field_length=[%i]", pds_field_length)
+            LOGGER.debug("pds_field_data=[%s]", str(pds_field_data))
         return_values["PDS" + pds_field_tag] = pds_field_data
 
         # increment the fieldPointer
@@ -555,40 +824,35 @@ def _icc_to_dict(field_data):
     :return: dictionary of de55 key values
              key is tag+tagid
     """
-    TWO_BYTE_TAG_PREFIXES = [b'\x9f', b'\x5f']
-
     field_pointer = 0
-    return_values = {"ICC_DATA": binascii.b2a_hex(field_data).decode()}
-
-    while field_pointer < len(field_data):
-        # get the tag id (one byte)
-        field_tag = field_data[field_pointer:field_pointer+1]
-        # set to 2 bytes if 2 byte tag
-        if field_tag in TWO_BYTE_TAG_PREFIXES:
-            field_tag = field_data[field_pointer:field_pointer+2]
-            field_pointer += 2
-        else:
-            field_pointer += 1
+    field_end = len(field_data)
+    return_values = {"ICC_DATA": field_data.hex()}
+    debug = LOGGER.isEnabledFor(logging.DEBUG)
 
-        field_tag_display = binascii.b2a_hex(field_tag)
-        LOGGER.debug("field_tag_display=%s", field_tag_display)
+    while field_pointer < field_end:
+        # get the tag id (one byte, or 2 bytes if 2 byte tag)
+        tag_length = _ICC_TAG_LENGTHS[field_data[field_pointer]]
+        field_tag = field_data[field_pointer:field_pointer+tag_length]
+        field_pointer += tag_length
+
+        field_tag_display = field_tag.hex()
+        if debug:
+            LOGGER.debug("field_tag_display=%s", field_tag_display)
 
         # stop processing de55 if low values tag found
-        if field_tag_display == b'00':
+        if field_tag_display == '00':
             break
 
-        field_length_raw = field_data[field_pointer:field_pointer+1]
-        LOGGER.debug(f"{field_length_raw=}")
-        field_length = struct.unpack(">B", field_length_raw)[0]
-
-        LOGGER.debug("%s", format(field_tag_display))
-        LOGGER.debug(field_length)
+        # get the tag length (one byte)
+        field_length = field_data[field_pointer]
 
         # get the tag data
         de_field_data = field_data[field_pointer+1:field_pointer+field_length+1]
-        de_field_data_display = binascii.b2a_hex(de_field_data).decode()
-        LOGGER.debug("%s", de_field_data_display)
-        return_values["TAG" + field_tag_display.upper().decode()] = de_field_data_display
+        de_field_data_display = de_field_data.hex()
+        if debug:
+            LOGGER.debug("field_length=%s", field_length)
+            LOGGER.debug("%s", de_field_data_display)
+        return_values["TAG" + field_tag_display.upper()] = de_field_data_display
 
         # increment the fieldPointer
         field_pointer += 1+field_length
@@ -610,8 +874,7 @@ def _get_de43_fields(de43_field, processor_config=None):
         return dict()
 
     # perform regex field matching
-    de43_regex = processor_config
-    field_match = re.match(de43_regex, de43_field)
+    field_match = _compile_regex(processor_config).match(de43_field)
     if not field_match:
         return dict()
 
@@ -622,6 +885,17 @@ def _get_de43_fields(de43_field, processor_config=None):
     return field_dict
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_regex(pattern):
+    """
+    Compile a field processor regex pattern, caching the compiled pattern
+
+    :param pattern: regex pattern string from the field processor config
+    :return: compiled regex pattern
+    """
+    return re.compile(pattern)
+
+
 if __name__ == '__main__':
     import doctest
     doctest.testmod()
@@ -5,6 +5,8 @@ from cryptography.hazmat.backends import default_backend
 
 backend = default_backend()
 
+_KCV_ZERO_BLOCK = b'\x00' * 16
+
 
 def get_zone_master_key(*key_parts: str) -> (str, str):
     """
@@ -13,9 +15,10 @@ def get_zone_master_key(*key_parts: str) -> (str, str):
     :param key_parts: list of keys components to be combined
     :return: clear key, key check value
     """
-    p1 = '00' * 16
+    clear_key = 0
     for key_part in key_parts:
-        p1 = f'{int(p1, 16) ^ int(key_part, 16):032x}'
+        clear_key ^= int(key_part, 16)
+    p1 = f'{clear_key:032x}'
     binary_key = unhexlify(p1)
     kcv = calculate_kcv(binary_key)
 
@@ -36,20 +39,22 @@ def calculate_kcv(binary_key: bytes, kvc_length: int = 6) -> str:
     :param kvc_length: length of kvc value: default is 6
     :return: key check value
     """
-    cipher = Cipher(d_algorithms.TripleDES(binary_key), modes.ECB(), backend=backend)
-    encryptor = cipher.encryptor()
-    ct = encryptor.update(b'\x00' * 16) + encryptor.finalize()
+    encryptor = _tdes_ecb_encryptor(binary_key)
+    ct = encryptor.update(_KCV_ZERO_BLOCK) + encryptor.finalize()
     return hexlify(ct)[0:kvc_length].decode()
 
 
 def encrypt_key(key_to_encrypt: str, master_key: str) -> bytes:
     binary_key = unhexlify(master_key)
     binary_data = unhexlify(key_to_encrypt)
-    cipher = Cipher(d_algorithms.TripleDES(binary_key), modes.ECB(), backend=backend)
-    encryptor = cipher.encryptor()
+    encryptor = _tdes_ecb_encryptor(binary_key)
     return encryptor.update(binary_data) + encryptor.finalize()
 
 
+def _tdes_ecb_encryptor(binary_key: bytes):
+    return Cipher(d_algorithms.TripleDES(binary_key), modes.ECB(), backend=backend).encryptor()
+
+
 if __name__ == '__main__':
     k1 = '6D6BE51F04F76167491554FE25F7ABEF'
     k2 = '67499B2CF137DFCB9EA28FF757CD10A7'
@@ -88,7 +88,10 @@ In this case, there is only one increment
     000003F0: 40 40 40 40 40 40                                 @@@@@@
 
 """
+import codecs
+import functools
 import io
+import itertools
 import logging
 import struct
 import typing
@@ -98,6 +101,9 @@ from cardutil.vendor import hexdump
 
 LOGGER = logging.getLogger(__name__)
 
+# VBS records are prefixed with a 4 byte big endian record length
+_RECORD_LENGTH = struct.Struct(">I")
+
 
 class MciIpmDataError(CardutilError):
     pass
@@ -129,33 +135,28 @@ class Block1014(object):
         """
         Write requested bytes to the output file object.
         """
+        LOGGER.debug('bytes_to_write=%s', bytes_to_write)
         # not enough bytes to complete a block, just write and subtract from remaining
-        LOGGER.debug(f'bytes_to_write={bytes_to_write}')
         if len(bytes_to_write) < self.remaining_chars:
-            LOGGER.debug(f'len->{len(bytes_to_write)}<{self.remaining_chars}')
-            LOGGER.debug(f'write {bytes_to_write}')
             self.file_obj.write(bytes_to_write)
             self.remaining_chars -= len(bytes_to_write)
             return
 
-        # complete the first record
-        LOGGER.debug(f'write first: {bytes_to_write[:self.remaining_chars]}')
-        self.file_obj.write(bytes_to_write[:self.remaining_chars])
-        self.file_obj.write(self.PAD_CHAR * 2)
-        bytes_to_write = bytes_to_write[self.remaining_chars:]
-
-        # now write complete blocks
-        while len(bytes_to_write) > 1012:
-            LOGGER.debug(f'write while: {bytes_to_write[:1012]}')
-            self.file_obj.write(bytes_to_write[:1012])
-            self.file_obj.write(self.PAD_CHAR * 2)
-            bytes_to_write = bytes_to_write[1012:]
-
-        # write whatever is left
-        LOGGER.debug(f'write last: {bytes_to_write}')
-        self.file_obj.write(bytes_to_write)
-        self.remaining_chars = 1012-len(bytes_to_write)
-        LOGGER.debug(f'remaining_chars={self.remaining_chars}')
+        # complete the first block
+        position = self.remaining_chars
+        blocks = [bytes_to_write[:position], self.PAD_CHAR * 2]
+
+        # now add complete blocks
+        while len(bytes_to_write) - position > 1012:
+            blocks.append(bytes_to_write[position:position + 1012])
+            blocks.append(self.PAD_CHAR * 2)
+            position += 1012
+
+        # add whatever is left and write in a single call
+        blocks.append(bytes_to_write[position:])
+        self.file_obj.write(b''.join(blocks))
+        self.remaining_chars = 1012 - (len(bytes_to_write) - position)
+        LOGGER.debug('remaining_chars=%s', self.remaining_chars)
 
     def seek(self, pos: int) -> None:
         """
@@ -186,10 +187,19 @@ class Unblock1014(object):
     """
     Unblocks 1014 blocked file objects.
     Wrap around a 1014 blocked file object. Return file like object providing only unblocked data
+
+    Blocks are read ahead of the data returned, so ``tell`` and ``seek`` use positions in the
+    unblocked data rather than the wrapped file object. The blocks must start at the beginning
+    of the wrapped file object.
     """
+    # number of blocks to read from the file object at a time
+    read_blocks = 64
+
     def __init__(self, file_obj: typing.BinaryIO):
         self.file_obj = file_obj
         self.buffer = b''
+        self.buffer_position = 0
+        self.buffer_start = 0  # position of the buffer in the unblocked data
 
     def __getattr__(self, name: str) -> any:
         """
@@ -207,15 +217,56 @@ class Unblock1014(object):
         Read requested bytes from the file object. Returned data will be unblocked
         """
         read_all = True if not bytes_to_read else False
-        while read_all or len(self.buffer) <= bytes_to_read:
-            block = self.file_obj.read(1014)
-            if not block:  # eof
-                break
-            self.buffer += block[:1012]
-        output = self.buffer[:bytes_to_read]
-        self.buffer = self.buffer[bytes_to_read:]
+        available = len(self.buffer) - self.buffer_position
+        if read_all or available <= bytes_to_read:
+            # refill the buffer with the unread data followed by the unblocked data from the next blocks
+            unblocked = [self.buffer[self.buffer_position:]]
+            while read_all or available <= bytes_to_read:
+                blocks = self.file_obj.read(1014 * self.read_blocks)
+                if not blocks:  # eof
+                    break
+                for block_start in range(0, len(blocks), 1014):
+                    unblocked.append(blocks[block_start:block_start + 1012])
+                    available += len(unblocked[-1])
+            self.buffer = b''.join(unblocked)
+            self.buffer_start += self.buffer_position
+            self.buffer_position = 0
+        if read_all:
+            bytes_to_read = len(self.buffer)
+        output = self.buffer[self.buffer_position:self.buffer_position + bytes_to_read]
+        self.buffer_position += len(output)
         return output
 
+    def tell(self) -> int:
+        """
+        Position of the next byte to be read in the unblocked data
+        """
+        return self.buffer_start + self.buffer_position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Seek to a position in the unblocked data
+
+        .. note:: Only seeking from the start or current position is supported
+
+        :param offset: position in the unblocked data
+        :param whence: io.SEEK_SET or io.SEEK_CUR
+        :return: the new position
+        """
+        if whence == io.SEEK_CUR:
+            offset += self.tell()
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation('Unblock1014 can only seek from the start or current position')
+
+        block, block_offset = divmod(offset, 1012)
+        self.file_obj.seek(block * 1014)
+        self.buffer = b''
+        self.buffer_position = 0
+        self.buffer_start = block * 1012
+        if block_offset:
+            self.read(block_offset)
+        return self.tell()
+
 
 class VbsReader(object):
     """
@@ -230,9 +281,15 @@ class VbsReader(object):
             for vbs_record in vbs_reader:
                 print(vbs_record)
 
+    Data is read from the file object ahead of the records returned. The ``read``, ``tell``
+    and ``seek`` methods account for the data read ahead, so they can be mixed with iteration.
+
     """
     record_number = 1
-    last_record = None
+    _last_record = None
+    _last_record_value = None
+    # number of bytes to read from the file object at a time, records are sliced from the read data
+    read_size = 1 << 16
 
     def __init__(self, vbs_file: typing.BinaryIO, blocked: bool = False):
         """
@@ -243,6 +300,8 @@ class VbsReader(object):
         self.vbs_data = vbs_file
         if blocked:
             self.vbs_data = Unblock1014(vbs_file)
+        self._buffer = b''
+        self._buffer_position = 0
 
     def __getattr__(self, name) -> any:
         """
@@ -258,43 +317,121 @@ class VbsReader(object):
     def __iter__(self):
         return self
 
+    @property
+    def last_record(self) -> bytes:
+        """
+        The last record read including the record length, None if no records have been read
+        """
+        if self._last_record is None:
+            return self._last_record_value
+        return _RECORD_LENGTH.pack(len(self._last_record)) + self._last_record
+
+    @last_record.setter
+    def last_record(self, value: bytes) -> None:
+        self._last_record = None
+        self._last_record_value = value
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Read bytes from the VBS data, starting after the last record returned
+
+        :param size: number of bytes to read, all remaining bytes if negative or None
+        :return: bytes read
+        """
+        unread = self._buffer[self._buffer_position:]
+        if size is not None and 0 <= size <= len(unread):
+            self._buffer_position += size
+            return unread[:size]
+        self._buffer = b''
+        self._buffer_position = 0
+        if size is None or size < 0:
+            return unread + self.vbs_data.read()
+        return unread + self.vbs_data.read(size - len(unread))
+
+    def tell(self) -> int:
+        """
+        Position of the next unread byte in the VBS data
+        """
+        return self.vbs_data.tell() - (len(self._buffer) - self._buffer_position)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Seek to a position in the VBS data, discarding any data read ahead
+
+        :param offset: position in the VBS data
+        :param whence: io.SEEK_SET, io.SEEK_CUR or io.SEEK_END
+        :return: the new position
+        """
+        if whence == io.SEEK_CUR:
+            offset += self.tell()
+            whence = io.SEEK_SET
+        self._buffer = b''
+        self._buffer_position = 0
+        return self.vbs_data.seek(offset, whence)
+
     def __next__(self) -> bytes:
         """
         Unpacks a variable blocked object into records
         """
-        record_length_raw = self.vbs_data.read(4)
-        if len(record_length_raw) != 4:
+        if self._fill_buffer(4) < 4:
             # this can happen if the VBS does not have a zero length record at end.
             # You can recreate using VbsWriter and not calling close method.
             # The reader will just accept we are at end if this happens.
-            LOGGER.warning(f'Unable to read next record length - requested 4 bytes,'
-                           f' got {len(record_length_raw)} -- assuming end of data')
+            LOGGER.warning('Unable to read next record length - requested 4 bytes,'
+                           ' got %s -- assuming end of data', len(self._buffer) - self._buffer_position)
+            self._buffer_position = len(self._buffer)
             raise StopIteration
 
-        record_length = struct.unpack(">I", record_length_raw)[0]
+        record_length = _RECORD_LENGTH.unpack_from(self._buffer, self._buffer_position)[0]
         LOGGER.debug("record_length=%s", record_length)
 
         # throw mcipm data error if length is negative or excessively large (indicates bad input)
         if record_length < 0 or record_length > 3000:
+            record_length_raw = self._buffer[self._buffer_position:self._buffer_position + 4]
+            self._buffer_position += 4
             raise MciIpmDataError(f"Invalid record length - value read was {record_length}",
                                   record_number=self.record_number,
                                   binary_context_data=record_length_raw)
 
         # exit if last record (length=0)
         if record_length == 0:
+            self._buffer_position += 4
             raise StopIteration
 
-        record = self.vbs_data.read(record_length)
+        self._fill_buffer(4 + record_length)
+        record_start = self._buffer_position + 4
+        record = self._buffer[record_start:record_start + record_length]
+        self._buffer_position = record_start + len(record)
         if len(record) != record_length:
             raise MciIpmDataError(f"Unable to read complete record - record length: {record_length}, "
                                   f"data read: {len(record)}",
                                   record_number=self.record_number,
-                                  binary_context_data=record_length_raw + record)
+                                  binary_context_data=self._buffer[record_start - 4:self._buffer_position])
 
-        self.last_record = record_length_raw + record  # save last record read
+        self._last_record = record  # save last record read
         self.record_number += 1    # increment record counter
         return record  # get the full record including the record length
 
+    def _fill_buffer(self, size: int) -> int:
+        """
+        Read data into the buffer until it holds at least size unread bytes, or the data ends
+
+        :param size: the number of unread bytes required
+        :return: the number of unread bytes in the buffer
+        """
+        available = len(self._buffer) - self._buffer_position
+        if available < size:
+            data = [self._buffer[self._buffer_position:]]
+            while available < size:
+                read_data = self.vbs_data.read(max(self.read_size, size - available))
+                if not read_data:
+                    break
+                data.append(read_data)
+                available += len(read_data)
+            self._buffer = b''.join(data)
+            self._buffer_position = 0
+        return available
+
 
 class IpmReader(VbsReader):
     """
@@ -337,7 +474,7 @@ class IpmReader(VbsReader):
     def __next__(self) -> dict:
 
         vbs_record = super(IpmReader, self).__next__()
-        LOGGER.debug(f'{len(vbs_record)}: {vbs_record}')
+        LOGGER.debug('%s: %s', len(vbs_record), vbs_record)
         try:
             output = iso8583.loads(vbs_record, encoding=self.encoding, iso_config=self.iso_config)
         except CardutilError as ex:
@@ -411,6 +548,7 @@ class IpmParamReader(VbsReader):
         self.table_id = table_id
         self.table_index = dict()
         self.expanded = expanded
+        self._field_parsers = dict()
         super(IpmParamReader, self).__init__(param_file, **kwargs)
 
         # check if config available for table id
@@ -430,7 +568,7 @@ class IpmParamReader(VbsReader):
             if record.startswith('TRAILER RECORD IP0000T1'):
                 trailer_record_found = True
                 break
-        LOGGER.debug('IP0000T1 records: {}'.format(self.table_index))
+        LOGGER.debug('IP0000T1 records: %s', self.table_index)
         if not trailer_record_found:
             raise MciIpmDataError('parameter file missing IP0000T1 trailer record')
 
@@ -456,30 +594,69 @@ class IpmParamReader(VbsReader):
                     self._C_ACTIVE_INACTIVE_CODE
                 ].decode(self.encoding)
 
-            LOGGER.debug(f"{record_table_id=}, {record=}")
+            LOGGER.debug("record_table_id=%r, record=%r", record_table_id, record)
             if record_table_id == self.table_id:
                 record_dict = {
                     "table_id": record_table_id,
                     "effective_timestamp": record_effective_timestamp,
                     "active_inactive_code": record_active_inactive_code,
                 }
-                for field in self.param_config[record_table_id]:
-                    record_dict[field] = self._get_param_field(record, field)
+                record_dict.update(self._get_param_fields(record, record_table_id))
                 return record_dict
 
-    def _get_param_field(self, record, field):
-        field_offset = 0
-        if self.expanded:
-            record_table_id = record[self._X_TABLE_ID].decode(self.encoding)
-        else:
-            record_table_id = self.table_index.get(
-                record[self._C_TABLE_SUB_ID].decode(self.encoding)
-            )
-            field_offset = -8  # all fields should be offset by this value
-        return record[
-            self.param_config[record_table_id][field]["start"] + field_offset:
-            self.param_config[record_table_id][field]["end"] + field_offset
-        ].decode(self.encoding)
+    def _get_param_fields(self, record, record_table_id):
+        try:
+            field_parser = self._field_parsers[record_table_id]
+        except KeyError:
+            # compressed table fields should all be offset by -8
+            field_offset = 0 if self.expanded else -8
+            field_parser = self._field_parsers[record_table_id] = _get_param_field_parser(
+                self.param_config[record_table_id], field_offset, self.encoding)
+        return field_parser(record)
+
+
+def _get_param_field_parser(
+    table_config: dict, field_offset: int, encoding: str
+) -> typing.Callable[[bytes], typing.Iterable[typing.Tuple[str, str]]]:
+    """
+    Create a function that extracts the parameter table fields from a record.
+
+    When the fields are in order and do not overlap, the layout is compiled to a struct format
+    so every field is extracted with a single unpack call. Records shorter than the layout are
+    sliced field by field so trailing fields are returned short or empty.
+
+    :param table_config: the parameter table config containing field start and end positions
+    :param field_offset: value to add to the configured field positions
+    :param encoding: the parameter file encoding
+    :return: function taking a record and returning an iterable of (field name, value) pairs
+    """
+    field_names = tuple(table_config)
+    field_slices = tuple(
+        slice(table_config[field]["start"] + field_offset, table_config[field]["end"] + field_offset)
+        for field in field_names
+    )
+
+    def slice_fields(record):
+        return zip(field_names, [record[field_slice].decode(encoding) for field_slice in field_slices])
+
+    struct_format = ">"
+    position = 0
+    for field_slice in field_slices:
+        if field_slice.start < position or field_slice.stop < field_slice.start:
+            return slice_fields
+        if field_slice.start > position:
+            struct_format += f"{field_slice.start - position}x"
+        struct_format += f"{field_slice.stop - field_slice.start}s"
+        position = field_slice.stop
+    record_struct = struct.Struct(struct_format)
+    unpack_fields = record_struct.unpack_from
+
+    def unpack_fields_or_slice(record):
+        if len(record) < record_struct.size:
+            return slice_fields(record)
+        return zip(field_names, [value.decode(encoding) for value in unpack_fields(record)])
+
+    return unpack_fields_or_slice
 
 
 class VbsWriter(object):
@@ -504,6 +681,8 @@ class VbsWriter(object):
         ...         writer.write(b'This is the record')
 
     """
+    batch_size = 1 << 16
+
     def __init__(self, out_file: typing.BinaryIO, blocked: bool = False):
         self.out_file = out_file
         if blocked:
@@ -527,24 +706,30 @@ class VbsWriter(object):
         :param record: byte string containing data
         :return: None
         """
-        # get the length of the record
-        record_length = len(record)
-        # convert length to binary
-        record_length_raw = struct.pack(">I", record_length)
-        # add length to output data
-        self.out_file.write(record_length_raw)
-        # add data to output
-        self.out_file.write(record)
+        # prefix the record with its binary length and write both in one call
+        self.out_file.write(_RECORD_LENGTH.pack(len(record)) + record)
 
     def write_many(self, iterable: typing.Iterable[bytes]) -> None:
         """
-        Convenience method to write multiple records from an iterable
+        Convenience method to write multiple records from an iterable.
+        Records are collected and written in batches of ``batch_size`` bytes.
 
         :param iterable: iterable providing records as bytes
         :return: None
         """
-        for record in iterable:
-            self.write(record)
+        pack_length = _RECORD_LENGTH.pack
+        batch = bytearray()
+        try:
+            for record in iterable:
+                batch += pack_length(len(record))
+                batch += record
+                if len(batch) >= self.batch_size:
+                    self.out_file.write(batch)
+                    batch = bytearray()
+        finally:
+            # records already taken from the iterable are written even if it raises
+            if batch:
+                self.out_file.write(batch)
 
     def close(self) -> None:
         """
@@ -553,7 +738,7 @@ class VbsWriter(object):
         :return: None
         """
         # add zero length to end of record
-        self.out_file.write(struct.pack(">I", 0))
+        self.out_file.write(_RECORD_LENGTH.pack(0))
         self.out_file.seek(0)
 
     def __enter__(self, *args, **kwargs):
@@ -630,8 +815,83 @@ class IpmWriter(VbsWriter):
         :param iterable: iterable providing records as dict
         :return: None
         """
-        for record in iterable:
-            self.write(record)
+        super(IpmWriter, self).write_many(
+            iso8583.dumps(obj, encoding=self.encoding, iso_config=self.iso_config) for obj in iterable)
+
+
+def transcode_records(
+    records: typing.Iterable[bytes], in_encoding: str, out_encoding: str
+) -> typing.Iterable[bytes]:
+    """
+    Change the encoding of text records, such as IPM parameter file records.
+
+    Records are returned unchanged if the encodings are the same, and converted with a
+    translation table (see :py:func:`get_translate_table`) if the encodings map byte for byte.
+    Otherwise each record is decoded and encoded.
+
+    :param records: iterable providing records as bytes
+    :param in_encoding: the input record encoding
+    :param out_encoding: the output record encoding
+    :return: iterable providing the converted records as bytes
+    """
+    if codecs.lookup(in_encoding).name == codecs.lookup(out_encoding).name:
+        return records
+    # ascii records do not change between ascii compatible encodings (e.g. latin_1 and utf-8)
+    ascii_unchanged = _is_ascii_compatible(in_encoding) and _is_ascii_compatible(out_encoding)
+    translate_table = get_translate_table(in_encoding, out_encoding)
+    if translate_table:
+        if ascii_unchanged:
+            return (record if record.isascii() else record.translate(translate_table) for record in records)
+        # map calls bytes.translate directly, without a generator frame per record
+        return map(bytes.translate, records, itertools.repeat(translate_table))
+    # look up the codec functions once rather than by name for every record
+    decode, encode = codecs.getdecoder(in_encoding), codecs.getencoder(out_encoding)
+    if ascii_unchanged:
+        return (record if record.isascii() else encode(decode(record)[0])[0] for record in records)
+    return (encode(decode(record)[0])[0] for record in records)
+
+
+# stateless codecs that encode ascii characters as the same single bytes
+_ASCII_COMPATIBLE_CODECS = frozenset(
+    ['ascii', 'utf-8']
+    + [f'iso8859-{part}' for part in range(1, 17)]
+    + [f'cp{code_page}' for code_page in range(1250, 1259)])
+
+
+@functools.lru_cache(maxsize=None)
+def _is_ascii_compatible(encoding: str) -> bool:
+    """
+    Check if ascii characters are encoded as the same bytes in the encoding
+
+    Only known stateless codecs qualify. Stateful codecs such as iso2022_jp also encode text
+    as ascii bytes, using escape sequences, so ascii records are not unchanged text.
+    """
+    return codecs.lookup(encoding).name in _ASCII_COMPATIBLE_CODECS
+
+
+def translate_ipm_records(
+    reader: VbsReader, translate_table: bytes, encoding: str = None, iso_config: dict = None
+) -> typing.Iterator[bytes]:
+    """
+    Generator that converts the IPM records from a VbsReader to another single byte encoding.
+    The records are translated directly without parsing to dict, see :py:func:`cardutil.iso8583.translate`
+
+    :param reader: VbsReader providing the IPM records
+    :param translate_table: 256 byte translation table, see :py:func:`get_translate_table`
+    :param encoding: the input file encoding
+    :param iso_config: config dict with key bit_config
+    :return: iterator providing translated records as bytes
+    """
+    for record in reader:
+        try:
+            yield iso8583.translate(record, translate_table, encoding=encoding, iso_config=iso_config)
+        except CardutilError as ex:
+            raise MciIpmDataError(
+                'Error while processing ISO8583 record',
+                binary_context_data=reader.last_record,
+                record_number=reader.record_number,
+                original_exception=ex
+            )
 
 
 def unblock_1014(input_data: typing.BinaryIO, output_data: typing.BinaryIO):
@@ -677,6 +937,25 @@ def block_1014(input_data: typing.BinaryIO, output_data: typing.BinaryIO):
     input_data.seek(0)
 
 
+@functools.lru_cache(maxsize=None)
+def get_translate_table(in_encoding: str, out_encoding: str) -> typing.Optional[bytes]:
+    """
+    Get a ``bytes.translate`` table that converts data from one single byte encoding to another
+
+    :param in_encoding: encoding of the input data
+    :param out_encoding: encoding of the output data
+    :return: 256 byte translation table, or None if the encodings do not map byte for byte
+    """
+    try:
+        chars = bytes(range(256)).decode(in_encoding)
+        table = chars.encode(out_encoding)
+    except (UnicodeError, LookupError):
+        return None
+    if len(chars) != 256 or len(table) != 256:
+        return None
+    return table
+
+
 def vbs_list_to_bytes(byte_list: iter, **kwargs) -> bytes:
     """
     Convenience function for creating VBS byte strings (optionally blocked) from list of byte strings
@@ -734,8 +1013,7 @@ def ipm_info(input_data: typing.BinaryIO) -> dict:
 
     # check that the first 4 bytes contain a valid length
     # large lengths indicate file issues
-    length_bytes = sample_data[:4]
-    record_length = struct.unpack(">I", length_bytes)[0]
+    record_length = _RECORD_LENGTH.unpack_from(sample_data)[0]
     if record_length > 1000:
         output["reason"] = (f"First IPM record has large record size ({record_length}) which"
                             f" usually indicates a file issue")
@@ -772,10 +1050,9 @@ def block_1014_check(sample_data):
 
 
 def bitmap_check(bitmap: bytes) -> (bool, str):
-    LOGGER.debug(hexdump.hexdump(bitmap, result='return'))
-    bitarray = BitArray.BitArray()
-    bitarray.frombytes(bitmap)
-    bits = bitarray.tolist()
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(hexdump.hexdump(bitmap, result='return'))
+    bits = BitArray.bitmap_to_list(bitmap)
     for bit, bit_value in enumerate(bits):
         if bit == 0:  # bit 1 does not have config
             continue
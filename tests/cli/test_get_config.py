@@ -40,6 +40,23 @@ class GetConfigTestCase(unittest.TestCase):
         os.remove(config_full_filename)
         self.assertEqual(config, {"config": "hello2"})
 
+    def test_cli_config_cached(self):
+        with tempfile.NamedTemporaryFile('w+', delete=False) as config_file:
+            config_file.write('{"config": "hello3"}')
+            config_full_filename = config_file.name
+            config_file.close()
+        config = get_config("test", envvar="TEST_ENVVAR", cli_filename=config_full_filename)
+        self.assertIs(config, get_config("test", envvar="TEST_ENVVAR", cli_filename=config_full_filename))
+
+        # changed file is loaded again
+        with open(config_full_filename, 'w') as config_file:
+            config_file.write('{"config": "hello4"}')
+        mtime = os.path.getmtime(config_full_filename) + 10
+        os.utime(config_full_filename, (mtime, mtime))
+        config = get_config("test", envvar="TEST_ENVVAR", cli_filename=config_full_filename)
+        os.remove(config_full_filename)
+        self.assertEqual(config, {"config": "hello4"})
+
     def test_cli_config_not_found(self):
         config = get_config("test", envvar="TEST_ENVVAR", cli_filename="THIS_FILE_DOES_NOT_EXIST")
         self.assertIn('bit_config', config.keys())
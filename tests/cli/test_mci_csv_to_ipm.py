@@ -198,6 +198,16 @@ class MciCsvToIpmTestCase(unittest.TestCase):
         expected_dict = {'MTI': '1644', 'DE2': '123', 'DE3': '1     ', 'DE48': '0191003123', 'PDS0191': '123'}
         self.assertDictEqual(rec, expected_dict)
 
+    def test_csv_to_ipm_blank_and_short_rows(self):
+        """
+        Blank lines are skipped and short rows only load the fields provided
+        """
+        in_csv_data = 'MTI,DE2,DE3\n1644,123\n\n1644,456,1\n'
+        recs = self.run_cli_with_csv(in_csv_data, out_encoding='latin1')
+        self.assertEqual(len(recs), 2)
+        self.assertDictEqual(recs[0], {'MTI': '1644', 'DE2': '123'})
+        self.assertDictEqual(recs[1], {'MTI': '1644', 'DE2': '456', 'DE3': '1     '})
+
 
 if __name__ == '__main__':
     unittest.main()
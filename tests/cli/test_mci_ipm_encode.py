@@ -3,9 +3,9 @@ import os
 import tempfile
 import unittest
 
-from tests import message_ascii_raw, print_stream
+from tests import message_ascii_raw, message_ebcdic_raw, print_stream
 
-from cardutil.mciipm import VbsWriter
+from cardutil.mciipm import VbsWriter, VbsReader
 from cardutil.cli import mci_ipm_encode
 
 
@@ -31,6 +31,22 @@ class MciIpmEncodeTestCase(unittest.TestCase):
 
         self.assertEqual(vbs_in_value, ipm_out_value)
 
+    def test_mci_ipm_encode_translate(self):
+        vbs_in = io.BytesIO()
+        with VbsWriter(vbs_in) as writer:
+            writer.write_many([message_ascii_raw, message_ascii_raw])
+
+        ipm_out = io.BytesIO()
+        mci_ipm_encode.mci_ipm_encode(
+            vbs_in, ipm_out, in_encoding='latin_1', out_encoding='cp500', in_format='vbs', out_format='vbs')
+        self.assertEqual(list(VbsReader(ipm_out)), [message_ebcdic_raw, message_ebcdic_raw])
+
+    def test_mci_ipm_encode_same_encoding_copies_file(self):
+        vbs_in = io.BytesIO(b'data is copied without being read as IPM records')
+        ipm_out = io.BytesIO()
+        mci_ipm_encode.mci_ipm_encode(vbs_in, ipm_out, in_encoding='latin1', out_encoding='latin_1')
+        self.assertEqual(ipm_out.read(), vbs_in.getvalue())
+
     def test_mci_ipm_encode_cli_parser(self):
         args = vars(mci_ipm_encode.cli_parser().parse_args(['file1.ipm']))
         self.assertEqual(
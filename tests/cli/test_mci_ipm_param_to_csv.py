@@ -134,6 +134,12 @@ class MciIpmParamToCsvTestCase(unittest.TestCase):
                 mci_ipm_param_to_csv.mci_ipm_param_to_csv(
                     test_param_stream, test_csv_stream, config=MCI_PARAMETER_CONFIG, table_id='IP0040T1')
 
+    def test_csv_line_formatter(self):
+        formatter = mci_ipm_param_to_csv._get_csv_line_formatter(['a', 'b', 'c'])
+        self.assertEqual(formatter({'a': '1', 'b': ' 2', 'c': ''}), '1, 2,\n')
+        self.assertEqual(formatter({'a': 'x,y', 'b': 'a"b', 'c': 'l\nm'}), '"x,y","a""b","l\nm"\n')
+        self.assertEqual(formatter({'a': '1', 'b': '2', 'c': '3'}), '1,2,3\n')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,8 @@ import tempfile
 import unittest
 
 from cardutil.cli import mideu
+from cardutil.mciipm import vbs_bytes_to_list, vbs_list_to_bytes
+from tests import message_ascii_raw, message_ebcdic_raw
 
 CONFIG_DATA = """
 {
@@ -118,6 +120,18 @@ class MideuTestCases(unittest.TestCase):
         os.remove(in_ipm_name)
         os.remove(in_ipm_name + '.csv')
 
+    def test_mideu_convert_output(self):
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as out_ipm:
+            out_ipm.write(vbs_list_to_bytes([message_ascii_raw, message_ascii_raw], blocked=True))
+            in_ipm_name = out_ipm.name
+
+        mideu.cli_run(func=mideu.convert, input=in_ipm_name, sourceformat='ascii')
+        with open(in_ipm_name + '.out', 'rb') as out_file:
+            self.assertEqual(vbs_bytes_to_list(out_file.read(), blocked=True), [message_ebcdic_raw, message_ebcdic_raw])
+
+        os.remove(in_ipm_name)
+        os.remove(in_ipm_name + '.out')
+
     def test_mideu_convert(self):
         """
         Run mideu convert from cli_run
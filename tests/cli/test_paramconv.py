@@ -1,3 +1,4 @@
+import io
 import os
 import tempfile
 import unittest
@@ -97,3 +98,11 @@ class MciIpmParamEncodeTestCase(unittest.TestCase):
 
         os.remove(in_vbs_name)
         os.remove(output_file_name)
+
+    def test_mci_ipm_param_encode_same_encoding(self):
+        in_param_data = b'\x00\x00\x00\x04data\x00\x00\x00\x00'
+        with io.BytesIO(in_param_data) as in_param, io.BytesIO() as out_param:
+            paramconv.mci_ipm_param_encode(
+                in_param, out_param, in_encoding='latin1', out_encoding='latin_1', blocked=False)
+            self.assertEqual(0, out_param.tell())
+            self.assertEqual(in_param_data, out_param.read())
@@ -14,6 +14,37 @@ class BitArrayTestCase(unittest.TestCase):
         my_array.frombytes(b"\x01")
         self.assertEqual([True, False, False, False, False, False, False, False], my_array.tolist())
 
+    def test_multi_byte(self):
+        my_array = BitArray.BitArray()
+        my_array.frombytes(b"\x80\x01")
+        self.assertEqual([True] + [False] * 14 + [True], my_array.tolist())
+        my_array = BitArray.BitArray(endian='little')
+        my_array.frombytes(b"\x01\x80")
+        self.assertEqual([True] + [False] * 14 + [True], my_array.tolist())
+
+    def test_tolist_bitmap_sizes(self):
+        for size in (8, 16):
+            bitmap = b"\x80" + b"\x00" * (size - 2) + b"\x01"
+            self.assertEqual([True] + [False] * (size * 8 - 2) + [True], BitArray.bitmap_to_list(bitmap))
+
+    def test_fromlist(self):
+        my_array = BitArray.BitArray()
+        my_array.fromlist([True] + [False] * 14 + [1])
+        self.assertEqual(b"\x80\x01", my_array.tobytes())
+
+    def test_functions(self):
+        self.assertEqual([True] + [False] * 14 + [True], BitArray.bitmap_to_list(b"\x80\x01"))
+        self.assertEqual(b"\x80\x01", BitArray.list_to_bitmap([True] + [False] * 14 + [True]))
+        self.assertEqual(b"\x90\x00", BitArray.list_to_bitmap([1, 0, None, "x"] + [0] * 12))
+        self.assertEqual(b"", BitArray.list_to_bitmap([]))
+
+    def test_bitmap_bits(self):
+        self.assertEqual([1, 16], BitArray.bitmap_bits(b"\x80\x01"))
+        self.assertEqual([], BitArray.bitmap_bits(b"\x00" * 16))
+        bitmap = bytes.fromhex('f23c46c1a8e0e0008400000100000001')
+        bitmap_list = BitArray.bitmap_to_list(bitmap)
+        self.assertEqual([bit + 1 for bit in range(128) if bitmap_list[bit]], BitArray.bitmap_bits(bitmap))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,13 +1,18 @@
 import binascii
+import copy
 import datetime
 import decimal
+import logging
 import unittest
+from unittest import mock
 
-from cardutil import CardutilError
+from cardutil import CardutilError, iso8583
 from cardutil.config import config
 from cardutil.iso8583 import (
     BitArray, _iso8583_to_field, _field_to_iso8583, _iso8583_to_dict, _dict_to_iso8583, loads, dumps,
-    _pds_to_de, _pds_to_dict, _pytype_to_string, _icc_to_dict, _get_de43_fields, _get_date_from_string)
+    _pds_to_de, _pds_to_dict, _pytype_to_string, _icc_to_dict, _get_de43_fields, _get_date_from_string, translate,
+    _get_bit_table, _get_pds_bits, _string_to_datetime, _get_latin_1_table, clear_bit_table_cache)
+from cardutil.mciipm import get_translate_table
 
 from tests import message_ebcdic_raw, message_ascii_raw, message_ascii_raw_hex, message_ebcdic_raw_hex
 
@@ -70,6 +75,10 @@ class Iso8583TestCase(unittest.TestCase):
         self.assertEqual(
             ({'DE1': '4564320012321122'}, 18),
             _iso8583_to_field('1', {'field_type': 'LLVAR', 'field_length': 0}, b'164564320012321122'))
+        self.assertEqual(
+            ({'DE1': '4564320012321122'}, 18),
+            _iso8583_to_field(
+                '1', {'field_type': 'LLVAR', 'field_length': 0}, b'XX164564320012321122XX', field_pointer=2))
         self.assertEqual(
             ({'DE1': '456432******1122'}, 18),
             _iso8583_to_field(
@@ -117,6 +126,28 @@ class Iso8583TestCase(unittest.TestCase):
         with self.assertRaises(CardutilError):
             _iso8583_to_field('1', {'field_type': 'LLVAR', 'field_python_type': 'int', 'field_length': 0}, b'04XXXX')
 
+    def test_iso8583_to_field_ebcdic_length(self):
+        self.assertEqual(
+            ({'DE2': '4444555566667777'}, 18),
+            _iso8583_to_field(
+                '2', {'field_type': 'LLVAR', 'field_length': 0}, '164444555566667777'.encode('cp500'),
+                encoding='cp500'))
+        with self.assertRaises(CardutilError):
+            _iso8583_to_field('2', {'field_type': 'LLVAR', 'field_length': 0}, 'X6AB'.encode('cp500'), encoding='cp500')
+        self.assertEqual(
+            ({'DE4': 1234}, 6),
+            _iso8583_to_field(
+                '4', {'field_type': 'FIXED', 'field_python_type': 'int', 'field_length': 6}, '001234'.encode('cp500'),
+                encoding='cp500'))
+        self.assertEqual(b'0123456789', '0123456789'.encode('cp500').translate(_get_latin_1_table('cp500')))
+        self.assertIsNone(_get_latin_1_table('utf-8'))
+
+    def test_field_to_iso8583_length_prefix(self):
+        self.assertEqual(b'\xf0\xf3\xf1\xf2\xf3', _field_to_iso8583({'field_type': 'LLVAR'}, "123", encoding='cp500'))
+        self.assertEqual(b'004ABCD', _field_to_iso8583({'field_type': 'LLLVAR'}, "ABCD"))
+        # length too large for the prefix is written in full
+        self.assertEqual(b'100' + b'1' * 100, _field_to_iso8583({'field_type': 'LLVAR'}, "1" * 100))
+
     def test_field_to_iso8583(self):
         self.assertEqual(b'164564320012321122', _field_to_iso8583({'field_type': 'LLVAR'}, "4564320012321122"))
         self.assertEqual(
@@ -285,46 +316,27 @@ class Iso8583TestCase(unittest.TestCase):
         self.assertEqual(de43_irl['DE43_STATE'], '   ')
         self.assertEqual(de43_irl['DE43_COUNTRY'], 'IRL')
 
-    def test_get_date_from_string_use_fromisodate(self):
-        import builtins
-        import sys
-
-        # skip test if being run on py36 or less
-        if sys.version_info < (3, 7):
-            self.skipTest('Needs py37 or greater to run')
-
-        real_import = builtins.__import__
-
-        def mock_import(name, *vars):
-            if name == 'dateutil.parser':
-                raise ImportError
-            else:
-                return real_import(name, *vars)
+    def test_string_to_datetime(self):
+        for field_data, field_date_format in (
+                ('200102030405', '%y%m%d%H%M%S'), ('690101', '%y%m%d'), ('681231', '%y%m%d'),
+                ('310199', '%d%m%y'), ('2001020304', '%y%m%d%H%M'), ('20200102', '%Y%m%d'), ('2011 2', '%y%m%d')):
+            self.assertEqual(
+                datetime.datetime.strptime(field_data, field_date_format),
+                _string_to_datetime(field_data, field_date_format))
+        for field_data in ('200230', '201301', '2001', '20010A'):
+            with self.assertRaises(ValueError):
+                _string_to_datetime(field_data, '%y%m%d')
 
-        builtins.__import__ = mock_import
-        self.get_date_from_string()
-        builtins.__import__ = real_import
+    def test_get_date_from_string_use_fromisodate(self):
+        with mock.patch.object(iso8583, '_get_dateutil_parser', return_value=None):
+            self.get_date_from_string()
 
     def test_get_date_from_string_use_builtin(self):
-        import sys
-        import builtins
-
-        real_version = sys.version_info
-        sys.version_info = (3, 6)
-        real_import = builtins.__import__
-
-        def mock_import(name, *vars):
-            if name == 'dateutil.parser':
-                raise ImportError
-            else:
-                return real_import(name, *vars)
-
-        builtins.__import__ = mock_import
-        self.get_date_from_string()
-        with self.assertRaises(ValueError):
-            _get_date_from_string("11221-11-22")
-        builtins.__import__ = real_import
-        sys.version_info = real_version
+        with mock.patch.object(iso8583, '_get_dateutil_parser', return_value=None), \
+                mock.patch('sys.version_info', (3, 6)):
+            self.get_date_from_string()
+            with self.assertRaises(ValueError):
+                _get_date_from_string("11221-11-22")
 
     def test_get_date_from_string_use_dateutil(self):
         try:
@@ -335,11 +347,88 @@ class Iso8583TestCase(unittest.TestCase):
         print(dateutil)
         self.get_date_from_string()
 
+    def test_translate(self):
+        message = {'MTI': '1240', 'DE2': '1234', 'DE55': b'\x9f\x26\x02\x40\x41', 'DE71': 1}
+        table = get_translate_table('latin_1', 'cp500')
+        self.assertEqual(translate(dumps(message), table), dumps(message, encoding='cp500'))
+        self.assertEqual(translate(message_ascii_raw, table), message_ebcdic_raw)
+
+    def test_translate_exceptions(self):
+        table = get_translate_table('latin_1', 'cp500')
+        with self.assertRaises(CardutilError):
+            translate(b'1240', table)
+        with self.assertRaises(CardutilError):
+            translate(b'ABCD' + b'\x00' * 16, table)
+        with self.assertRaises(CardutilError):
+            translate(dumps({'MTI': '1240', 'DE2': '1234'}) + b'1', table)
+        with self.assertRaises(CardutilError):
+            translate(b'1240\x40' + b'\x00' * 15 + b'XX', table)
+
     def get_date_from_string(self):
         self.assertEqual(_get_date_from_string("2002-01-01"), datetime.datetime(2002, 1, 1))
         self.assertEqual(_get_date_from_string("2002-01-01 10:01"), datetime.datetime(2002, 1, 1, 10, 1))
         self.assertEqual(_get_date_from_string("2002-01-01 10:01:02"), datetime.datetime(2002, 1, 1, 10, 1, 2))
 
+    def test_get_bit_table(self):
+        bit_config = {"2": {"field_name": "PAN", "field_type": "LLVAR", "field_length": 19}}
+        bit_table = _get_bit_table(bit_config)
+        self.assertEqual(129, len(bit_table))
+        self.assertIs(bit_config["2"], bit_table[2].bit_config)
+        self.assertEqual(19, bit_table[2].field_length)
+        self.assertEqual(2, bit_table[2].length_size)
+        self.assertEqual("DE2", bit_table[2].field_key)
+        self.assertIsNone(bit_table[2].field_converter)
+        self.assertIsNone(bit_table[2].field_formatter)
+        self.assertIsNone(bit_table[3])
+        self.assertIs(bit_table, _get_bit_table(bit_config))
+        self.assertEqual((), _get_pds_bits(bit_config))
+        self.assertEqual((125, 124, 123, 62, 48), _get_pds_bits(config['bit_config']))
+
+        # adding a bit rebuilds the table
+        bit_config["3"] = {
+            "field_name": "Processing code", "field_type": "FIXED", "field_length": 6, "field_python_type": "int"}
+        self.assertIs(bit_config["3"], _get_bit_table(bit_config)[3].bit_config)
+        self.assertIs(int, _get_bit_table(bit_config)[3].field_converter)
+        self.assertEqual({"MTI": "1144", "DE3": 0},
+                         loads(b"1144\x20" + b"\x00" * 15 + b"000000", iso_config=bit_config))
+
+    def test_get_bit_table_config_changes(self):
+        bit_config = copy.deepcopy(config['bit_config'])
+        message = dumps({'MTI': '1144', 'DE4': 1234}, iso_config=bit_config)
+        self.assertEqual({'MTI': '1144', 'DE4': 1234}, loads(message, iso_config=bit_config))
+
+        # edit inside a bit's config
+        bit_config['4']['field_python_type'] = 'string'
+        clear_bit_table_cache()
+        self.assertEqual({'MTI': '1144', 'DE4': '000000001234'}, loads(message, iso_config=bit_config))
+
+        # replace a bit's config
+        bit_config['4'] = dict(bit_config['4'], field_python_type='int')
+        clear_bit_table_cache()
+        self.assertEqual({'MTI': '1144', 'DE4': 1234}, loads(message, iso_config=bit_config))
+
+        # pds bits follow processor changes
+        bit_config['48']['field_processor'] = None
+        clear_bit_table_cache()
+        self.assertEqual((125, 124, 123, 62), _get_pds_bits(bit_config))
+
+        # a new config dictionary does not need the cache cleared
+        new_bit_config = copy.deepcopy(bit_config)
+        new_bit_config['4']['field_python_type'] = 'string'
+        self.assertEqual({'MTI': '1144', 'DE4': '000000001234'}, loads(message, iso_config=new_bit_config))
+
+    def test_loads_debug_hexdump(self):
+        message = b'1144\x20' + b'\x00' * 15 + b'000000'
+        logger = logging.getLogger('cardutil.iso8583')
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.INFO)
+        with mock.patch('cardutil.iso8583.hexdump') as hexdump:
+            loads(message)
+            hexdump.assert_not_called()
+            with self.assertLogs('cardutil.iso8583', level=logging.DEBUG):
+                loads(message)
+            hexdump.assert_called_once_with(message, result='return')
+
 
 if __name__ == '__main__':
     unittest.main()
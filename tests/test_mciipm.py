@@ -4,7 +4,8 @@ import unittest
 from cardutil import CardutilError
 from cardutil.mciipm import (
     VbsWriter, VbsReader, IpmReader, IpmWriter, Block1014, Unblock1014, block_1014, unblock_1014, vbs_list_to_bytes,
-    vbs_bytes_to_list, IpmParamReader, MciIpmDataError, ipm_info)
+    vbs_bytes_to_list, IpmParamReader, MciIpmDataError, ipm_info, get_translate_table,
+    transcode_records)
 from tests import message_ascii_raw, message_ebcdic_raw, print_stream
 
 
@@ -169,6 +170,57 @@ class MciIpmTestCase(unittest.TestCase):
             print(results)
             self.assertEqual(results, records)
 
+    def test_vbsreader_small_reads(self):
+        """
+        records and record lengths that span the reader buffer refills are read correctly
+        """
+        records = [b'1', b'12345678901234567890' * 60, b'abc' * 500, b'x']
+        for blocked in (False, True):
+            with io.BytesIO() as in_data:
+                with VbsWriter(in_data, blocked=blocked) as writer:
+                    writer.write_many(records)
+
+                reader = VbsReader(in_data, blocked=blocked)
+                reader.read_size = 7
+                if blocked:
+                    reader.vbs_data.read_blocks = 1
+                self.assertIsNone(reader.last_record)
+                self.assertEqual(list(reader), records)
+                self.assertEqual(reader.last_record, b'\x00\x00\x00\x01x')
+
+    def test_vbsreader_file_position(self):
+        """
+        tell, seek and read account for the data the reader has read ahead
+        """
+        records = [b'first record', b'x' * 2000, b'third record']
+        for blocked in (False, True):
+            with io.BytesIO() as in_data:
+                with VbsWriter(in_data, blocked=blocked) as writer:
+                    writer.write_many(records)
+                if blocked:
+                    unblocked_data = Unblock1014(in_data).read()
+                    in_data.seek(0)
+                else:
+                    unblocked_data = in_data.getvalue()
+
+                reader = VbsReader(in_data, blocked=blocked)
+                self.assertEqual(next(reader), records[0])
+                self.assertEqual(reader.tell(), 16)
+                self.assertEqual(reader.read(4), unblocked_data[16:20])
+                self.assertEqual(reader.tell(), 20)
+                reader.seek(0)
+                self.assertEqual(list(reader), records)
+                self.assertEqual(reader.tell(), 2040)
+                reader.seek(-2040, io.SEEK_CUR)
+                self.assertEqual(reader.read(), unblocked_data)
+                reader.seek(16)
+                self.assertEqual(next(reader), records[1])
+
+                reader.last_record = b'replaced'
+                self.assertEqual(reader.last_record, b'replaced')
+                self.assertEqual(next(reader), records[2])
+                self.assertEqual(reader.last_record, b'\x00\x00\x00\x0cthird record')
+
     def test_vbsreader_exceptions(self):
         # create the input file bytes -- test_file
         with io.BytesIO() as in_data:
@@ -320,6 +372,64 @@ class MciIpmTestCase(unittest.TestCase):
         print(vbs_list)
         self.assertEqual(vbs_list, test_bytes_list)
 
+    def test_get_translate_table(self):
+        data = 'Parameter message data 0123456789'
+        table = get_translate_table('latin_1', 'cp500')
+        self.assertEqual(data.encode('latin_1').translate(table), data.encode('cp500'))
+        # not a byte for byte mapping
+        self.assertIsNone(get_translate_table('cp500', 'ascii'))
+        self.assertIsNone(get_translate_table('latin_1', 'utf-8'))
+        self.assertIsNone(get_translate_table('utf-8', 'latin_1'))
+
+    def test_vbswriter_write_many_batches(self):
+        records = [b'x' * length for length in (1, 1011, 1012, 1013, 3000, 0, 20)]
+        for blocked in (True, False):
+            expected = io.BytesIO()
+            with VbsWriter(expected, blocked=blocked) as writer:
+                for record in records:
+                    writer.write(record)
+            for batch_size in (1, 1500, 1 << 16):
+                out = io.BytesIO()
+                with VbsWriter(out, blocked=blocked) as writer:
+                    writer.batch_size = batch_size
+                    writer.write_many(records)
+                self.assertEqual(out.getvalue(), expected.getvalue())
+
+    def test_vbswriter_write_many_iterable_exception(self):
+        def failing_records():
+            yield b'record 1'
+            yield b'record 2'
+            raise ValueError('bad record')
+
+        out = io.BytesIO()
+        with self.assertRaises(ValueError):
+            with VbsWriter(out) as writer:
+                writer.write_many(failing_records())
+        self.assertEqual(
+            out.getvalue(), b'\x00\x00\x00\x08record 1\x00\x00\x00\x08record 2\x00\x00\x00\x00')
+
+    def test_transcode_records(self):
+        records = [b'record 1', b'record 2']
+        self.assertIs(transcode_records(records, 'latin1', 'latin_1'), records)
+        self.assertEqual(list(transcode_records(records, 'latin_1', 'cp500')),
+                         [record.decode('latin_1').encode('cp500') for record in records])
+        self.assertEqual(list(transcode_records(records, 'ascii', 'utf-16')),
+                         [record.decode('ascii').encode('utf-16') for record in records])
+        with self.assertRaises(UnicodeError):
+            list(transcode_records([b'\xff'], 'cp500', 'ascii'))
+        # ascii compatible encodings
+        records = [b'ascii record', 'non-ascii record \xe9'.encode('latin_1')]
+        self.assertEqual(list(transcode_records(records, 'latin_1', 'utf-8')),
+                         [record.decode('latin_1').encode('utf-8') for record in records])
+        self.assertEqual(list(transcode_records(records, 'latin_1', 'cp1252')),
+                         [record.decode('latin_1').encode('cp1252') for record in records])
+        # stateful encodings write multibyte text as ascii escape sequences
+        records = ['\u65e5\u672c'.encode('iso2022_jp')]
+        self.assertTrue(records[0].isascii())
+        self.assertEqual(list(transcode_records(records, 'iso2022_jp', 'utf-8')), [b'\xe6\x97\xa5\xe6\x9c\xac'])
+        self.assertEqual(
+            list(transcode_records([b'\xe6\x97\xa5'], 'utf-8', 'iso2022_jp')), ['\u65e5'.encode('iso2022_jp')])
+
     def test_ipm_param_reader(self):
         param_file_data = [
             b'2011101414AIP0000T1IP0000T1 TABLE LIST                 ' + 188 * b'.' + b'001',
@@ -374,6 +484,37 @@ class MciIpmTestCase(unittest.TestCase):
 
         self.assertEqual(1, len(output))
 
+    def test_ipm_param_reader_field_layouts(self):
+        """
+        fields are unpacked for full records and sliced for short records or overlapping fields
+        """
+        param_config = {
+            "IP0040T1": {"low": {"start": 19, "end": 23}, "high": {"start": 25, "end": 28}},
+            "IP0000T1": {},
+        }
+        param_file_data = [
+            b'2014101414AIP0000T1IP0040T1 ACCOUNT RANGE TABLE        ' + 188 * b'.' + b'036',
+            b'TRAILER RECORD IP0000T1  00000218                                               ',
+            b'1711114A036' + b'1234..567..',
+            b'1711114A036' + b'1234..5',
+        ]
+
+        with io.BytesIO() as test_param_stream:
+            with VbsWriter(test_param_stream) as test_param_vbs:
+                test_param_vbs.write_many(param_file_data)
+
+            test_param_stream.seek(0)
+            output = list(IpmParamReader(test_param_stream, table_id="IP0040T1", param_config=param_config))
+
+            param_config["IP0040T1"]["high"] = {"start": 20, "end": 23}
+            test_param_stream.seek(0)
+            overlap_output = list(IpmParamReader(test_param_stream, table_id="IP0040T1", param_config=param_config))
+
+        self.assertEqual(
+            [("1234", "567"), ("1234", "5")], [(record["low"], record["high"]) for record in output])
+        self.assertEqual(
+            [("1234", "234"), ("1234", "234")], [(record["low"], record["high"]) for record in overlap_output])
+
 
 class MciIpmInfoTestCase(unittest.TestCase):
     def test_ipm_info_filelength_less_than_24(self):